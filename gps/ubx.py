@@ -47,14 +47,7 @@ def uint2int(u, bit):
 def unpack_s11(word, pos):
     """Grab a signed 11 bits from offset pos of word"""
 
-    ubytes = bytearray(2)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0x07
-    if 0x04 & ubytes[1]:
-        # extend the sign
-        ubytes[1] |= 0xf8
-    u = struct.unpack_from('<h', ubytes, 0)
-    return u[0]
+    return uint2int((word >> pos) & 0x07ff, 11)
 
 
 def unpack_s11s(word):
@@ -69,137 +62,79 @@ def unpack_s11s(word):
 def unpack_s14(word, pos):
     """Grab a signed 14 bits from offset pos of word"""
 
-    ubytes = bytearray(2)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0x3f
-    if 0x20 & ubytes[1]:
-        # extend the sign
-        ubytes[1] |= 0xc0
-    u = struct.unpack_from('<h', ubytes, 0)
-    return u[0]
+    return uint2int((word >> pos) & 0x3fff, 14)
 
 
 def unpack_s16(word, pos):
     """Grab a signed two bytes from offset pos of word"""
 
-    ubytes = bytearray(2)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0xff
-    u = struct.unpack_from('<h', ubytes, 0)
-    return u[0]
+    return uint2int((word >> pos) & 0xffff, 16)
 
 
 def unpack_u16(word, pos):
     """Grab a unsigned two bytes from offset pos of word"""
 
-    ubytes = bytearray(2)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0xff
-    u = struct.unpack_from('<H', ubytes, 0)
-    return u[0]
+    return (word >> pos) & 0xffff
 
 
 def unpack_u17(word, pos):
     """Grab an unsigned 17 bits from offset pos of word"""
 
-    return unpack_u24(word, pos) & 0x01ffff
+    return (word >> pos) & 0x01ffff
 
 
 def unpack_s22(word, pos):
     """Grab a signed 22 bits from offset pos of word"""
 
-    ubytes = bytearray(4)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0xff
-    ubytes[2] = (word >> (pos + 16)) & 0x3f
-    ubytes[3] = 0
-    if 0x20 & ubytes[2]:
-        # extend the sign
-        ubytes[2] |= 0xc0
-        ubytes[3] = 0xff
-
-    u = struct.unpack_from('<l', ubytes, 0)
-    return u[0]
+    return uint2int((word >> pos) & 0x3fffff, 22)
 
 
 def unpack_s24(word, pos):
     """Grab a signed 24 bits from offset pos of word"""
 
-    ubytes = bytearray(4)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0xff
-    ubytes[2] = (word >> (pos + 16)) & 0xff
-    ubytes[3] = 0
-    if 0x80 & ubytes[2]:
-        # extend the sign
-        ubytes[3] = 0xff
-
-    u = struct.unpack_from('<l', ubytes, 0)
-    return u[0]
+    return uint2int((word >> pos) & 0xffffff, 24)
 
 
 def unpack_u24(word, pos):
     """Grab an unsigned 24 bits from offset pos of word"""
 
-    ubytes = bytearray(4)
-    ubytes[0] = (word >> pos) & 0xff
-    ubytes[1] = (word >> (pos + 8)) & 0xff
-    ubytes[2] = (word >> (pos + 16)) & 0xff
-    ubytes[3] = 0
-
-    u = struct.unpack_from('<L', ubytes, 0)
-    return u[0]
+    return (word >> pos) & 0xffffff
 
 
 def unpack_s32s(word, word1):
     """Grab an signed 32 bits from weird split word, word1"""
 
-    ubytes = bytearray(4)
-    ubytes[0] = (word >> 6) & 0xff
-    ubytes[1] = (word >> 14) & 0xff
-    ubytes[2] = (word >> 22) & 0xff
-    ubytes[3] = (word1 >> 6) & 0xff
-
-    u = struct.unpack_from('<l', ubytes, 0)
-    return u[0]
+    return uint2int(unpack_u32s(word, word1), 32)
 
 
 def unpack_u32s(word, word1):
     """Grab an unsigned 32 bits from weird split word, word1"""
 
-    ubytes = bytearray(4)
-    ubytes[0] = (word >> 6) & 0xff
-    ubytes[1] = (word >> 14) & 0xff
-    ubytes[2] = (word >> 22) & 0xff
-    ubytes[3] = (word1 >> 6) & 0xff
-
-    u = struct.unpack_from('<L', ubytes, 0)
-    return u[0]
+    return ((word >> 6) & 0xffffff) | (((word1 >> 6) & 0xff) << 24)
 
 
 def unpack_s8(word, pos):
     """Grab a signed byte from offset pos of word"""
 
-    ubytes = bytearray(1)
-    ubytes[0] = (word >> pos) & 0xff
-    u = struct.unpack_from('<b', ubytes, 0)
-    return u[0]
+    return uint2int((word >> pos) & 0xff, 8)
 
 
 def unpack_u8(word, pos):
     """Grab an unsigned byte from offset pos of word"""
 
-    ubytes = bytearray(1)
-    ubytes[0] = (word >> pos) & 0xff
-    u = struct.unpack_from('<B', ubytes, 0)
-    return u[0]
+    return (word >> pos) & 0xff
 
 
 def flag_s(flag, descs):
-    """Decode flag using descs, return a string.  Ignores unknown bits."""
+    """Decode flag using descs, return a string.  Ignores unknown bits.
+
+descs is a dict, or a tuple of (bit, name) pairs already in bit order."""
+
+    if isinstance(descs, dict):
+        descs = sorted(descs.items())
 
     s = ''
-    for key, value in sorted(descs.items()):
+    for key, value in descs:
         if key == (key & flag):
             s += value
             s += ' '
@@ -2566,7 +2501,7 @@ Deprecated in protVer 34.00
 
         # newer u-blox have 10 octets, e.g. u-blox 6 w/ protVer 13
         if 9 < m_len:
-            u = struct.unpack_from('<BB', buf[8:], 0)
+            u = struct.unpack_from('<BB', buf, 8)
             s += (" %u %u" % u)
 
         if gps.VERB_DECODE <= self.verbosity:
@@ -2830,13 +2765,13 @@ Deprecated in protVer 34.00
         s = (" filter x%x nmeaVersion x%x numSv %u flags x%x " % u)
 
         if 11 < len(buf):
-            u1 = struct.unpack_from('<LBBBB', buf[4:], 0)
+            u1 = struct.unpack_from('<LBBBB', buf, 4)
             s += ("gnssToFilter x%x\n svNumbering %u"
                   " mainTalkerId %u gsvTalkerId %u version %u" % u1)
             u += u1
 
         if 19 < len(buf):
-            u2 = struct.unpack_from('<BBBBBBBB', buf[12:], 0)
+            u2 = struct.unpack_from('<BBBBBBBB', buf, 12)
             s += ("\n bdsTalkerId %u %u reserved1 %u %u %u %u %u %u" % u2)
             u += u2
 
@@ -3072,7 +3007,7 @@ Deprecated in protVer 34.00
                  (flag_s(u[5], self.cfg_prt_proto),
                   flag_s(u[6], self.cfg_prt_proto)))
 
-        if portid in set([1, 2, 4, 0]):
+        if portid in (1, 2, 4, 0):
             s.append('    flags (%s)' % flag_s(u[7], self.cfg_prt_flags))
 
         return '\n'.join(s)
@@ -3124,14 +3059,12 @@ Deprecated in protVer 34.00
         # u-blox 5, protVer 6.00 to 6.02
         m_len = len(buf)
 
-        u = struct.unpack_from('<B', buf, 0)
         s = (" flags x%x (%s) data:" %
-             (u + (flag_s(u[0], self.cfg_rinv_flags),)))
+             (buf[0], flag_s(buf[0], self.cfg_rinv_flags)))
         for i in range(0, m_len - 1):
             if 0 == (i % 8):
                 s += "\n   "
-            u = struct.unpack_from('<B', buf, i + 1)
-            s += " %3u" % u
+            s += " %3u" % buf[i + 1]
 
         return s
 
@@ -3523,7 +3456,6 @@ Only for models with built in USB.
 
     def cfg_valdel(self, buf):
         """"UBX-CFG-VALDEL decode, Delete configuration items"""
-        m_len = len(buf)
 
         # this is a poll options, so does not set min protver
 
@@ -3533,14 +3465,10 @@ Only for models with built in USB.
               (flag_s(u[1], self.cfg_valdel_layers),
                index_s(u[2], self.cfg_valxxx_trans)))
 
-        m_len -= 4
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<L', buf, 4 + i * 4)
+        for i in range(4, len(buf), 4):
+            u = struct.unpack_from('<L', buf, i)
             item = self.cfg_by_key(u[0])
             s += ('\n    item: %s/%#x' % (item[0], u[0]))
-            m_len -= 4
-            i += 1
         return s
 
     def cfg_valget(self, buf):
@@ -3555,16 +3483,13 @@ Only for models with built in USB.
         s += '  layers (%s)' % index_s(u[1], self.cfg_valget_layers)
 
         m_len -= 4
-        i = 0
 
         if 0 == u[0]:
             # this is a poll option, so does not set min protver
-            while 0 < m_len:
-                u = struct.unpack_from('<L', buf, 4 + i * 4)
+            for i in range(4, len(buf), 4):
+                u = struct.unpack_from('<L', buf, i)
                 item = self.cfg_by_key(u[0])
                 s += ('\n    item %s/%#x' % (item[0], u[0]))
-                m_len -= 4
-                i += 1
         else:
             # answer to poll
             # we are at least protver 27
@@ -3572,7 +3497,7 @@ Only for models with built in USB.
                 self.protver = 27
 
             # sort of duplicated in cfg_valset()
-            i += 4
+            i = 4
             while 4 < m_len:
                 u = struct.unpack_from('<L', buf, i)
                 m_len -= 4
@@ -3916,20 +3841,18 @@ Only for models with built in USB.
             s += "\nERROR:  numMeas != blocks!!"
             return s
 
-        n = 0
         s1 = ''
-        while n < blocks:
+        for n in range(blocks):
             u1 = struct.unpack_from('<L', buf, 8 + (4 * n))
             data_type = (u1[0] >> 24) & 0x03f
             data = u1[0] & 0x0ffffff
-            if data_type in [5, 11, 12, 13, 14, 16, 17, 18]:
+            if data_type in (5, 11, 12, 13, 14, 16, 17, 18):
                 # 24 signed data
                 data = uint2int(data, 24)
             if gps.VERB_DECODE <= self.verbosity:
                 s1 = ' (%s)' % index_s(data_type, self.esf_raw_type)
             s += ('\n     dataType %3u%s dataField %7d' %
                   (data_type, s1, data))
-            n += 1
         if u[1] & 0x08:
             # calibTtagValid
             u1 = struct.unpack_from('<L', buf, 8 + (4 * numMeas))
@@ -3952,20 +3875,18 @@ Only for models with built in USB.
 
         u = struct.unpack_from('<L', buf, 0)
         s = ' reserved1 x%x blocks %u' % (u[0], blocks)
-        n = 0
         s1 = ''
-        while n < blocks:
+        for n in range(blocks):
             u = struct.unpack_from('<LL', buf, 4 + (8 * n))
             data_type = (u[0] >> 24) & 0x0ff
             data = u[0] & 0x0ffffff
-            if data_type in [5, 11, 12, 13, 14, 16, 17, 18]:
+            if data_type in (5, 11, 12, 13, 14, 16, 17, 18):
                 # 24 bit signed data
                 data = uint2int(data, 24)
             if gps.VERB_DECODE <= self.verbosity:
                 s1 = " (%s)" % index_s(data_type, self.esf_raw_type)
             s += ('\n   data_type %3u%s data %8d sTtag %u' %
                   (data_type, s1, data, u[1]))
-            n += 1
         return s
 
     esf_status_fusionMode = {
@@ -3995,8 +3916,7 @@ Only for models with built in USB.
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n     fusionMode (%s)" %
                   index_s(u[10], self.esf_status_fusionMode))
-        n = 0
-        while n < blocks:
+        for n in range(blocks):
             u = struct.unpack_from('<BBBB', buf, 16 + (4 * n))
             s += '\n   sensStatus1 %x sensStatus2 %x freq %u faults %u' % u
             if gps.VERB_DECODE <= self.verbosity:
@@ -4004,7 +3924,6 @@ Only for models with built in USB.
                       (index_s(u[0] & 0x3f, self.esf_raw_type),
                        'Yes' if (u[0] & 0x40) else 'No',
                        'Yes' if (u[0] & 0x80) else 'No'))
-            n += 1
         return s
 
     # UBX-ESF-
@@ -4073,7 +3992,6 @@ Only for models with built in USB.
 
     def hnr_pvt(self, buf):
         """UBX-HNR-PVT decode, High rate output of PVT solution"""
-        m_len = len(buf)
 
         # Not before protVet 19
         # 72 bytes long in protver 19.
@@ -4089,7 +4007,7 @@ Only for models with built in USB.
             s += ("\n    valid (%s)"
                   "\n    gpsFix (%s)"
                   "\n    flags (%s)" %
-                  (flag_s(u[7], self.nav_pvt_valid),
+                  (self.nav_pvt_valid_s[u[7]],
                    index_s(u[9], self.nav_pvt_fixType),
                    flag_s(u[10], self.hnr_pvt_flags)))
         return s
@@ -4833,11 +4751,10 @@ Deprecated in protVer 34.00
 
         # No way to poll
 
-        u = struct.unpack_from('<B', buf, 0)
-        s = "  flags: x%x" % u
+        s = "  flags: x%x" % buf[0]
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n  flags (%s)" %
-                  index_s(u[0], self.mon_rxr_flags))
+                  index_s(buf[0], self.mon_rxr_flags))
 
         return s
 
@@ -4999,10 +4916,12 @@ protVer 34.00 and up
                       'name': 'UBX-MON-RF'},
                }
 
+    nav_aopstatus_struct = struct.Struct('<LBBLLH')
+
     def nav_aopstatus(self, buf):
         """UBX-NAV-AOPSTATUS decode, AssistNow Autonomous Status"""
 
-        u = struct.unpack_from('<LBBLLH', buf, 0)
+        u = self.nav_aopstatus_struct.unpack_from(buf, 0)
         s = '  iTOW %u aopCfg %u status %u reserved1 %u %u %u' % u
         if gps.VERB_DECODE <= self.verbosity:
             aopCfg = {1: "useAOP"}
@@ -5010,20 +4929,24 @@ protVer 34.00 and up
 
         return s
 
+    nav_att_struct = struct.Struct('<LBHBlllLLL')
+
     def nav_att(self, buf):
         """UBX-NAV-ATT decode, Attitude Solution"""
 
-        u = struct.unpack_from('<LBHBlllLLL', buf, 0)
+        u = self.nav_att_struct.unpack_from(buf, 0)
         s = ("  iTOW %u version %u reserved1 %u %u\n"
              "  roll %d pitch %d heading %d\n"
              "  accRoll %d accPitch %d accHeading %d" % u)
 
         return s
 
+    nav_clock_struct = struct.Struct('<LllLL')
+
     def nav_clock(self, buf):
         """UBX-NAV-CLOCK decode, Clock Solution"""
 
-        u = struct.unpack_from('<LllLL', buf, 0)
+        u = self.nav_clock_struct.unpack_from(buf, 0)
         return '  iTOW %u clkB %d clkD %d tAcc %u fAcc %u' % u
 
     nav_dgps_status = {
@@ -5031,13 +4954,15 @@ protVer 34.00 and up
         1: "PR+PRR correction",
         }
 
+    nav_cov_struct = struct.Struct('<LBBBLLBffffffffffff')
+
     def nav_cov(self, buf):
         """UBX-NAV-COV decode, Covariance matrices
 
 protVer 34 and up
 """
 
-        u = struct.unpack_from('<LBBBLLBffffffffffff', buf, 0)
+        u = self.nav_cov_struct.unpack_from(buf, 0)
         return('  iTOW %u version %u posCovValid %u velCovValid %u '
                'reserved0 %u %u %u\n'
                ' posCovNN %f posCovNE  %f posCovND %f\n'
@@ -5045,40 +4970,49 @@ protVer 34 and up
                ' velCovNN %f velCovNE  %f velCovND %f\n'
                ' velCovEE %f velCovED  %f velCovDD %f\n' % u)
 
+    nav_dgps_struct = struct.Struct('<LlhhBBH')
+    nav_dgps_sv_struct = struct.Struct('<BbHff')
+
     def nav_dgps(self, buf):
         """UBX-NAV-DGPS decode, DGPS Data used for NAV"""
 
+        verbose = gps.VERB_DECODE <= self.verbosity
+
         # not present in protver 27+
-        u = struct.unpack_from('<LlhhBBH', buf, 0)
-        s = (' iTOW %u age %d baseID %d basehealth %d numCh %u\n'
-             ' status x%x reserved1 %u' % u)
-        if gps.VERB_DECODE <= self.verbosity:
-            s += ("\n  status (%s)" %
-                  index_s(u[5], self.nav_dgps_status))
+        u = self.nav_dgps_struct.unpack_from(buf, 0)
+        s = [' iTOW %u age %d baseID %d basehealth %d numCh %u\n'
+             ' status x%x reserved1 %u' % u]
+        if verbose:
+            s.append("  status (%s)" %
+                     self.nav_dgps_status.get(u[5], "Unk"))
 
         for i in range(0, u[4]):
-            u = struct.unpack_from('<BbHff', buf, 16 + i * 12)
-            s += ('\n  svid %3u flags x%2x ageC %u prc %f prcc %f' % u)
-            if gps.VERB_DECODE <= self.verbosity:
-                s += ("\n   channel %u dgps %u" %
-                      (u[1] & 0x0f, (u[1] >> 4) & 1))
+            u = self.nav_dgps_sv_struct.unpack_from(buf, 16 + i * 12)
+            s.append('  svid %3u flags x%2x ageC %u prc %f prcc %f' % u)
+            if verbose:
+                s.append("   channel %u dgps %u" %
+                         (u[1] & 0x0f, (u[1] >> 4) & 1))
 
-        return s
+        return '\n'.join(s)
+
+    nav_dop_struct = struct.Struct('<Lhhhhhhh')
 
     def nav_dop(self, buf):
         """UBX-NAV-DOP decode, Dilution of Precision"""
 
-        u = struct.unpack_from('<Lhhhhhhh', buf, 0)
+        u = self.nav_dop_struct.unpack_from(buf, 0)
         s = ('  iTOW %u gDOP %u pDOP %u tDOP %u vDOP %u\n'
              '  hDOP %u nDOP %u eDOP %u' % u)
         return s
 
     # UBX-NAV-EELL, protVer 19.1 and up, ADR only
 
+    nav_eoe_struct = struct.Struct('<L')
+
     def nav_eoe(self, buf):
         """UBX-NAV-EOE decode, End Of Epoch"""
 
-        u = struct.unpack_from('<L', buf, 0)
+        u = self.nav_eoe_struct.unpack_from(buf, 0)
         return ' iTOW %u' % u
 
     nav_geofence_state = {
@@ -5091,47 +5025,58 @@ protVer 34 and up
         1: "Active",
         }
 
+    nav_geofence_struct = struct.Struct('<LBBBB')
+    nav_geofence_fence_struct = struct.Struct('<BB')
+
     def nav_geofence(self, buf):
         """UBX-NAV-GEOFENCE decode, Geofencing status"""
 
-        u = struct.unpack_from('<LBBBB', buf, 0)
-        s = '  iTOW:%u version %u status %u numFences %u combState %u' % u
-        if gps.VERB_DECODE <= self.verbosity:
-            s += ("\n    status (%s) combState (%s)" %
-                  (index_s(u[2], self.nav_geofence_status),
-                   index_s(u[4], self.nav_geofence_state)))
+        verbose = gps.VERB_DECODE <= self.verbosity
+
+        u = self.nav_geofence_struct.unpack_from(buf, 0)
+        s = ['  iTOW:%u version %u status %u numFences %u combState %u' % u]
+        if verbose:
+            s.append("    status (%s) combState (%s)" %
+                     (self.nav_geofence_status.get(u[2], "Unk"),
+                      self.nav_geofence_state.get(u[4], "Unk")))
 
         for i in range(0, u[3]):
-            u = struct.unpack_from('<BB', buf, 8 + (i * 2))
-            s += '\n  state %u reserved1 %u' % u
-            if gps.VERB_DECODE <= self.verbosity:
-                s += ("\n    state (%s)" %
-                      (index_s(u[0], self.nav_geofence_state)))
+            u = self.nav_geofence_fence_struct.unpack_from(buf, 8 + (i * 2))
+            s.append('  state %u reserved1 %u' % u)
+            if verbose:
+                s.append("    state (%s)" %
+                         (self.nav_geofence_state.get(u[0], "Unk")))
 
-        return s
+        return '\n'.join(s)
+
+    nav_hpposecef_struct = struct.Struct('<BBBBLlllbbbbL')
 
     def nav_hpposecef(self, buf):
         """UBX-NAV-POSECEF decode, High Precision Position Solution in ECEF"""
 
-        u = struct.unpack_from('<BBBBLlllbbbbL', buf, 0)
+        u = self.nav_hpposecef_struct.unpack_from(buf, 0)
         return ('  version %u reserved1 %u %u %u iTOW %u\n'
                 '  ecef: X %d Y %d Z %d\n'
                 '  ecefHP: X %d Y %d Z %d\n'
                 '  reserved2 %u pAcc %u' % u)
 
+    nav_hpposllh_struct = struct.Struct('<BBBBLllllbbbbLL')
+
     def nav_hpposllh(self, buf):
         """UBX-NAV-HPPOSLLH decode, HP Geodetic Position Solution"""
 
-        u = struct.unpack_from('<BBBBLllllbbbbLL', buf, 0)
+        u = self.nav_hpposllh_struct.unpack_from(buf, 0)
         return ('  version %u reserved1 %u %u %u iTOW %u\n'
                 '  lon %d lat %d height %d hMSL %d\n'
                 '  lonHp %d latHp %d heightHp %d hMSLHp %d\n'
                 '  hAcc %u vAcc %u' % u)
 
+    nav_odo_struct = struct.Struct('<BBBBLLLL')
+
     def nav_odo(self, buf):
         """UBX-NAV-ODO decode, Odometer Solution"""
 
-        u = struct.unpack_from('<BBBBLLLL', buf, 0)
+        u = self.nav_odo_struct.unpack_from(buf, 0)
         return ("  version %u reserved1 %u %u %u iTOW %u\n"
                 "  distance %u totalDistance %u distanceStd %u" % u)
 
@@ -5159,59 +5104,69 @@ protVer 34 and up
             2: "Assist now autonomous data",
         }
 
+    nav_orb_struct = struct.Struct('<LBBH')
+    nav_orb_sv_struct = struct.Struct('<BBBBBB')
+
     def nav_orb(self, buf):
         """UBX-NAV-ORB decode, GNSS Orbit Database Info"""
 
-        u = struct.unpack_from('<LBBH', buf, 0)
-        s = "  iTOW %u version %u numSv %u reserved1 %u" % u
+        verbose = gps.VERB_DECODE <= self.verbosity
 
-        for i in range(0, u[2]):
-            u = struct.unpack_from('<BBBBBB', buf, 8 + (i * 6))
-            s += ("\n   gnssId %u svId %3u svFlag x%02x eph x%02x alm x%02x "
-                  "otherOrb x%x" % u)
-            if gps.VERB_DECODE <= self.verbosity:
+        u = self.nav_orb_struct.unpack_from(buf, 0)
+        s = ["  iTOW %u version %u numSv %u reserved1 %u" % u]
+
+        unpack_sv = self.nav_orb_sv_struct.unpack_from
+        for offset in range(8, 8 + (u[2] * 6), 6):
+            u = unpack_sv(buf, offset)
+            s.append("   gnssId %u svId %3u svFlag x%02x eph x%02x alm x%02x "
+                     "otherOrb x%x" % u)
+            if verbose:
                 eph = int(u[3] & 0x1f)
-                s1 = index_s(eph, self.nav_orb_ephUsability, nf="")
+                s1 = self.nav_orb_ephUsability.get(eph, "")
                 if not s1:
                     s1 = "%d to %d mins" % ((eph - 1) * 15, eph * 15)
 
                 alm = int(u[4] & 0x1f)
-                s2 = index_s(alm, self.nav_orb_almUsability, nf="")
+                s2 = self.nav_orb_almUsability.get(alm, "")
                 if not s2:
                     s2 = "%d to %d days" % (alm - 1, alm)
 
                 other = int(u[5] & 0x1f)
-                s3 = index_s(other, self.nav_orb_almUsability, nf="")
+                s3 = self.nav_orb_almUsability.get(other, "")
                 if not s3:
                     s3 = "%d to %d days" % (other - 1, other)
 
-                s += ("\n    (%s:%u) health (%s) visibility (%s)"
-                      "\n     ephUsability (%s) ephSource (%s)"
-                      "\n     almUsability (%s) almSource (%s)"
-                      "\n     anoAopUsability (%s) type (%s)" %
-                      (index_s(u[0], self.gnss_id), u[1],
-                       index_s(u[2] & 3, self.health),
-                       index_s((u[2] >> 2) & 3, self.visibility),
-                       s1,
-                       index_s(u[3] >> 5, self.nav_orb_ephSource, nf="other"),
-                       s2,
-                       index_s(u[4] >> 5, self.nav_orb_ephSource, nf="other"),
-                       s3,
-                       index_s(u[5] >> 5, self.nav_orb_type, nf="other")))
+                s.append("    (%s:%u) health (%s) visibility (%s)"
+                         "\n     ephUsability (%s) ephSource (%s)"
+                         "\n     almUsability (%s) almSource (%s)"
+                         "\n     anoAopUsability (%s) type (%s)" %
+                         (self.gnss_id.get(u[0], "Unk"), u[1],
+                          self.health.get(u[2] & 3, "Unk"),
+                          self.visibility.get((u[2] >> 2) & 3, "Unk"),
+                          s1,
+                          self.nav_orb_ephSource.get(u[3] >> 5, "other"),
+                          s2,
+                          self.nav_orb_ephSource.get(u[4] >> 5, "other"),
+                          s3,
+                          self.nav_orb_type.get(u[5] >> 5, "other")))
 
-        return s
+        return '\n'.join(s)
+
+    nav_posecef_struct = struct.Struct('<LlllL')
 
     def nav_posecef(self, buf):
         """UBX-NAV-POSECEF decode, Position Solution in ECEF"""
 
         # protVer 4+
-        u = struct.unpack_from('<LlllL', buf, 0)
+        u = self.nav_posecef_struct.unpack_from(buf, 0)
         return '  iTOW %u ecefX %d Y %d Z %d pAcc %u' % u
 
+    nav_posllh_struct = struct.Struct('<LllllLL')
+
     def nav_posllh(self, buf):
         """UBX-NAV-POSLLH decode, Geodetic Position Solution"""
 
-        u = struct.unpack_from('<LllllLL', buf, 0)
+        u = self.nav_posllh_struct.unpack_from(buf, 0)
         return ('  iTOW %u lon %d lat %d height %d\n'
                 '  hMSL %d hAcc %u vAcc %u' % u)
 
@@ -5222,6 +5177,9 @@ protVer 34 and up
         8: "validMag",      # protver 27
         }
 
+    # flag_s() of every possible valid byte, built once
+    nav_pvt_valid_s = tuple(map(flag_s, range(256), (nav_pvt_valid,) * 256))
+
     # u-blox TIME ONLY is same as Surveyed
     nav_pvt_fixType = {
         0: 'None',
@@ -5232,11 +5190,12 @@ protVer 34 and up
         5: 'Surveyed',
         }
 
-    nav_pvt_flags = {
-        1: "gnssFixOK",
-        2: "diffSoln",
-        0x20: "headVehValid",
-        }
+    # (bit, name) pairs, in bit order
+    nav_pvt_flags = (
+        (1, "gnssFixOK"),
+        (2, "diffSoln"),
+        (0x20, "headVehValid"),
+        )
 
     nav_pvt_flags2 = {
         0x20: "confirmedAvai",
@@ -5244,6 +5203,10 @@ protVer 34 and up
         0x80: "confirmedTime",
         }
 
+    # flag_s() of every possible flags2 byte, built once
+    nav_pvt_flags2_s = tuple(map(flag_s, range(256),
+                                 (nav_pvt_flags2,) * 256))
+
     nav_pvt_psm = {
         0: "Not Active",
         1: "Enabled",
@@ -5260,41 +5223,47 @@ protVer 34 and up
         2: "Fixed",
         }
 
+    nav_pvt_struct = struct.Struct('<LHBBBBBBLlBBBBllllLLlllllLLHHHH')
+    # protver 15 adds headVeh, magDec and magAcc
+    nav_pvt15_struct = struct.Struct('<LHBBBBBBLlBBBBllllLLlllllLLHHHHlhH')
+
     def nav_pvt(self, buf):
         """UBX-NAV-PVT decode, Navigation Position Velocity Time Solution"""
-        m_len = len(buf)
 
         # 84 bytes long in protver 14.
         # 92 bytes long in protver 15.
 
         # flags2 is protver 27
-        u = struct.unpack_from('<LHBBBBBBLlBBBBllllLLlllllLLHHHH', buf, 0)
-        s = ('  iTOW %u time %u/%u/%u %02u:%02u:%02u valid x%x\n'
+        if 92 <= len(buf):
+            # version 15, unpack it all at once
+            u = self.nav_pvt15_struct.unpack_from(buf, 0)
+        else:
+            u = self.nav_pvt_struct.unpack_from(buf, 0)
+        s = ['  iTOW %u time %u/%u/%u %02u:%02u:%02u valid x%x\n'
              '  tAcc %u nano %d fixType %u flags x%x flags2 x%x\n'
              '  numSV %u lon %d lat %d height %d\n'
              '  hMSL %d hAcc %u vAcc %u\n'
              '  velN %d velE %d velD %d gSpeed %d headMot %d\n'
-             '  sAcc %u headAcc %u pDOP %u reserved1 %u %u %u' % u)
+             '  sAcc %u headAcc %u pDOP %u reserved1 %u %u %u' % u[:31]]
 
-        if 92 <= m_len:
-            # version 15
-            u1 = struct.unpack_from('<lhH', buf, 81)
-            s += ('\n  headVeh %d magDec %d magAcc %u' % u1)
+        if 31 < len(u):
+            s.append('  headVeh %d magDec %d magAcc %u' % u[31:])
 
         if gps.VERB_DECODE <= self.verbosity:
-            s += ("\n    valid (%s)"
-                  "\n    fixType (%s)"
-                  "\n    flags (%s)"
-                  "\n    flags2 (%s)"
-                  "\n    psmState (%s)"
-                  "\n    carrSoln (%s)" %
-                  (flag_s(u[7], self.nav_pvt_valid),
-                   index_s(u[10], self.nav_pvt_fixType),
-                   flag_s(u[11], self.nav_pvt_flags),
-                   flag_s(u[12], self.nav_pvt_flags2),
-                   index_s((u[11] >> 2) & 0x0f, self.nav_pvt_psm),
-                   index_s((u[11] >> 6) & 0x03, self.carrSoln)))
-        return s
+            flags = u[11]
+            s.append("    valid (%s)"
+                     "\n    fixType (%s)"
+                     "\n    flags (%s)"
+                     "\n    flags2 (%s)"
+                     "\n    psmState (%s)"
+                     "\n    carrSoln (%s)" %
+                     (self.nav_pvt_valid_s[u[7]],
+                      self.nav_pvt_fixType.get(u[10], "Unk"),
+                      flag_s(flags, self.nav_pvt_flags),
+                      self.nav_pvt_flags2_s[u[12]],
+                      self.nav_pvt_psm.get((flags >> 2) & 0x0f, "Unk"),
+                      self.carrSoln.get((flags >> 6) & 0x03, "Unk")))
+        return '\n'.join(s)
 
     nav_relposned_flags = {
         1: "gnssFixOK",
@@ -5307,6 +5276,25 @@ protVer 34 and up
         0x200: "relPosNormalized",    # protVer 27.11+
         }
 
+    nav_relposned_struct = struct.Struct('<BBHLlll')
+    nav_relposned1_struct = struct.Struct('<llLbbbbLLLLLLL')
+    nav_relposned0_struct = struct.Struct('<bbbbLLLL')
+
+    # version: (minimum length, struct, format), flags is always last
+    nav_relposned_versions = {
+        # u-blox 8, and some u-blox 9
+        0: (40, nav_relposned0_struct,
+            '  relPosHPN %d relPosHPE %d relPosHPD %d reserved2 %u\n'
+            '  accN %u accE %u accD %u flags x%x'),
+        # newer u-blox 9
+        1: (64, nav_relposned1_struct,
+            '  relLength %d relHeading %d reserved2 %u\n'
+            '  relPosHPN %d relPosHPE %d relPosHPD %d '
+            'relPosHPLength %d\n'
+            '  accN %u accE %u accD %u accLength %u accHeading %u\n'
+            '  reserved3 %u flags x%x'),
+        }
+
     def nav_relposned(self, buf):
         """UBX-NAV-RELPOSNED decode
 Relative Positioning Information in NED frame.
@@ -5317,41 +5305,30 @@ High Precision GNSS products only."""
         m_len = len(buf)
 
         # common part
-        u = struct.unpack_from('<BBHLlll', buf, 0)
+        u = self.nav_relposned_struct.unpack_from(buf, 0)
         s = ('  version %u reserved1 %u refStationId %u iTOW %u\n'
              '  relPosN %d relPosE %d relPosD %d\n' % u)
 
-        if (1 == u[0] and 64 <= m_len):
-            # valid version 1 packet, newer u-blox 9
-            u1 = struct.unpack_from('<llLbbbbLLLLLLL', buf, 20)
-            s += ('  relLength %d relHeading %d reserved2 %u\n'
-                  '  relPosHPN %d relPosHPE %d relPosHPD %d '
-                  'relPosHPLength %d\n'
-                  '  accN %u accE %u accD %u accLength %u accHeading %u\n'
-                  '  reserved3 %u flags x%x' % u1)
-            flags = u1[13]
-        elif (0 == u[0] and 40 <= m_len):
-            # valid version 0 packet, u-blox 8, and some u-blox 9
-            u1 = struct.unpack_from('<bbbbLLLL', buf, 20)
-            s += ('  relPosHPN %d relPosHPE %d relPosHPD %d reserved2 %u\n'
-                  '  accN %u accE %u accD %u flags x%x' % u1)
-            flags = u1[7]
-        else:
+        variant = self.nav_relposned_versions.get(u[0])
+        if variant is None or m_len < variant[0]:
             # WTF?
             return "  Bad Length %d version %u combination" % (m_len, u[0])
 
+        u1 = variant[1].unpack_from(buf, 20)
+        s += variant[2] % u1
+        flags = u1[-1]
+
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n    flags (%s)\n"
                   "    carrSoln (%s)" %
                   (flag_s(flags, self.nav_relposned_flags),
-                   index_s((flags >> 3) & 0x03, self.carrSoln)))
+                   self.carrSoln.get((flags >> 3) & 0x03, "Unk")))
         return s
 
     def nav_resetodo(self, buf):
         """UBX-NAV-RESETODO decode, reset odometer"""
 
-        m_len = len(buf)
-        if 0 == m_len:
+        if 0 == len(buf):
             s = " reset request"
         else:
             s = " unexpected data"
@@ -5391,43 +5368,67 @@ High Precision GNSS products only."""
         7: "Other",
         }
 
-    nav_sat_flags = {
-        8: "svUsed",
-        0x40: "diffCorr",
-        0x80: "smoothed",
-        0x800: "ephAvail",
-        0x1000: "almAvail",
-        0x2000: "anoAvail",
-        0x4000: "aopAvail",
-        0x10000: "sbasCorrUsed",
-        0x20000: "rtcmCorrUsed",
-        0x40000: "slasCorrUsed",
-        0x80000: "spartnCorrUsed",
-        0x100000: "prCorrUsed",
-        0x200000: "crCorrUsed",
-        0x400000: "doCorrUsed",
-        }
+    # (bit, name) pairs, in bit order
+    nav_sat_flags = (
+        (8, "svUsed"),
+        (0x40, "diffCorr"),
+        (0x80, "smoothed"),
+        (0x800, "ephAvail"),
+        (0x1000, "almAvail"),
+        (0x2000, "anoAvail"),
+        (0x4000, "aopAvail"),
+        (0x10000, "sbasCorrUsed"),
+        (0x20000, "rtcmCorrUsed"),
+        (0x40000, "slasCorrUsed"),
+        (0x80000, "spartnCorrUsed"),
+        (0x100000, "prCorrUsed"),
+        (0x200000, "crCorrUsed"),
+        (0x400000, "doCorrUsed"),
+        )
+
+    nav_sat_struct = struct.Struct('<LBBH')
+    nav_sat_sv_struct = struct.Struct('<BBBbhhL')
 
     def nav_sat(self, buf):
         """UBX-NAV-SAT decode"""
 
-        u = struct.unpack_from('<LBBH', buf, 0)
-        s = '  iTOW %u version %u numSvs %u reserved1 x%x' % u
+        verbose = gps.VERB_DECODE <= self.verbosity
+
+        u = self.nav_sat_struct.unpack_from(buf, 0)
+        s = ['  iTOW %u version %u numSvs %u reserved1 x%x' % u]
+
+        # fetch the tables once, not once per SV
+        sat_flags = self.nav_sat_flags
+        qualityInd_get = self.qualityInd.get
+        health_get = self.health.get
+        orbit_get = self.nav_sat_orbit.get
+
+        # one template, and one format, per SV
+        sv_fmt = ('   gnssId %u svid %3u cno %2u elev %3d azim %3d '
+                  'prRes %6d flags x%x')
+        if verbose:
+            sv_fmt += ("\n     flags (%s)"
+                       "\n     qualityInd x%x (%s) health (%s)"
+                       "\n     orbitSource (%s)")
+
+        unpack_sv = self.nav_sat_sv_struct.unpack_from
+        for offset in range(8, 8 + (u[2] * 12), 12):
+            u = unpack_sv(buf, offset)
+            if verbose:
+                # split the flags word into its fields once
+                flags = u[6]
+                qualityInd = flags & 7
+                health = (flags >> 4) & 3
+                orbitSource = (flags >> 8) & 7
+                # flag_s(), inlined
+                u += (' '.join([name for bit, name in sat_flags
+                                if bit == bit & flags]),
+                      qualityInd, qualityInd_get(qualityInd, "Unk"),
+                      health_get(health, "Unk"),
+                      orbit_get(orbitSource, "Unk"))
+            s.append(sv_fmt % u)
 
-        for i in range(0, u[2]):
-            u = struct.unpack_from('<BBBbhhL', buf, 8 + (i * 12))
-            s += ('\n   gnssId %u svid %3u cno %2u elev %3d azim %3d prRes %6d'
-                  ' flags x%x' % u)
-            if gps.VERB_DECODE <= self.verbosity:
-                s += ("\n     flags (%s)"
-                      "\n     qualityInd x%x (%s) health (%s)"
-                      "\n     orbitSource (%s)" %
-                      (flag_s(u[6], self.nav_sat_flags),
-                       u[6] & 7, index_s(u[6] & 7, self.qualityInd),
-                       index_s((u[6] >> 4) & 3, self.health),
-                       index_s((u[6] >> 8) & 7, self.nav_sat_orbit)))
-
-        return s
+        return '\n'.join(s)
 
     nav_sbas_mode = {
         0: "Disabled",
@@ -5452,35 +5453,41 @@ High Precision GNSS products only."""
         8: "Testmode",
         }
 
+    nav_sbas_struct = struct.Struct('<LBBbBBBBB')
+    nav_sbas_sv_struct = struct.Struct('<BBBBBBhHh')
+
     def nav_sbas(self, buf):
         """UBX-NAV-SBAS decode, SBAS Status Data"""
 
+        verbose = gps.VERB_DECODE <= self.verbosity
+
         # present in protver 10+ (Antaris4 to ZOE-M8B
         # undocumented, but present in protver 27+
         # undocumented, but present in protver 32, NEO-M9N
 
-        u = struct.unpack_from('<LBBbBBBBB', buf, 0)
-        s = (" iTOW %d geo %u mode x%x sys %d service x%x cnt %u "
-             "reserved0 %u %u %u" % u)
-        if gps.VERB_DECODE <= self.verbosity:
-            s += ("\n    mode (%s) sys (%s)"
-                  "\n    service (%s)" %
-                  (index_s(u[2], self.nav_sbas_mode),
-                   index_s(u[3], self.nav_sbas_sys),
-                   flag_s(u[4], self.nav_sbas_service)))
-
-        for i in range(0, u[5]):
-            u = struct.unpack_from('<BBBBBBhHh', buf, 12 + (i * 12))
-            s += ("\n  svid %3d flags x%04x udre x%02x svSys %3d svService %2d"
-                  " reserved2 %u"
-                  "\n   prc %3d reserved3 %u ic %3d" % u)
-            if gps.VERB_DECODE <= self.verbosity:
+        u = self.nav_sbas_struct.unpack_from(buf, 0)
+        s = [" iTOW %d geo %u mode x%x sys %d service x%x cnt %u "
+             "reserved0 %u %u %u" % u]
+        if verbose:
+            s.append("    mode (%s) sys (%s)"
+                     "\n    service (%s)" %
+                     (self.nav_sbas_mode.get(u[2], "Unk"),
+                      self.nav_sbas_sys.get(u[3], "Unk"),
+                      flag_s(u[4], self.nav_sbas_service)))
+
+        unpack_sv = self.nav_sbas_sv_struct.unpack_from
+        for offset in range(12, 12 + (u[5] * 12), 12):
+            u = unpack_sv(buf, offset)
+            s.append("  svid %3d flags x%04x udre x%02x svSys %3d "
+                     "svService %2d reserved2 %u"
+                     "\n   prc %3d reserved3 %u ic %3d" % u)
+            if verbose:
                 # where are flags and udre defined??
-                s += ("\n   svSys (%s) svService (%s)" %
-                      (index_s(u[3], self.nav_sbas_sys),
-                       flag_s(u[4], self.nav_sbas_service)))
+                s.append("   svSys (%s) svService (%s)" %
+                         (self.nav_sbas_sys.get(u[3], "Unk"),
+                          flag_s(u[4], self.nav_sbas_service)))
 
-        return s
+        return '\n'.join(s)
 
     nav_sig_corrSource = {
         0: "None",
@@ -5501,41 +5508,60 @@ High Precision GNSS products only."""
         8: "Dual Frequency obs",
         }
 
-    nav_sig_sigFlags = {
-        4: "prSmoothed",
-        8: "prUsed",
-        0x10: "crUsed",
-        0x20: "doUsed",
-        0x40: "prCorrUsed",
-        0x80: "crCorrUsed",
-        0x100: "doCorrUsed",
-        }
+    # (bit, name) pairs, in bit order
+    nav_sig_sigFlags = (
+        (4, "prSmoothed"),
+        (8, "prUsed"),
+        (0x10, "crUsed"),
+        (0x20, "doUsed"),
+        (0x40, "prCorrUsed"),
+        (0x80, "crCorrUsed"),
+        (0x100, "doCorrUsed"),
+        )
+
+    nav_sig_struct = struct.Struct('<LBBH')
+    nav_sig_sig_struct = struct.Struct('<BBBBhBBBBHL')
 
     def nav_sig(self, buf):
         """UBX-NAV-SIG decode, Signal Information"""
 
-        u = struct.unpack_from('<LBBH', buf, 0)
-        s = '  iTOW %u version %u numSigs %u reserved1 %u' % u
-
-        for i in range(0, u[2]):
-            u = struct.unpack_from('<BBBBhBBBBHL', buf, 8 + (i * 16))
-            s += ('\n   gnssId %u svId %u sigId %u freqId %u prRes %d cno %u '
-                  'qualityInd %u\n'
-                  '    corrSource %u ionoModel %u sigFlags %#x reserved2 %u' %
-                  u)
-
-            if gps.VERB_DECODE <= self.verbosity:
-                s += ("\n      (%s) corrSource (%s)"
-                      "\n      qualityInd (%s)"
-                      "\n      ionoModel (%s) health (%s)"
-                      "\n      sigFlags (%s)" %
-                      (self.gnss_s(u[0], u[1], u[2]),
-                       index_s(u[7], self.nav_sig_corrSource),
-                       index_s(u[6], self.qualityInd),
-                       index_s(u[8], self.nav_sig_ionoModel),
-                       index_s(u[9] & 3, self.health),
-                       flag_s(u[9], self.nav_sig_sigFlags)))
-        return s
+        verbose = gps.VERB_DECODE <= self.verbosity
+
+        u = self.nav_sig_struct.unpack_from(buf, 0)
+        s = ['  iTOW %u version %u numSigs %u reserved1 %u' % u]
+
+        # fetch the tables once, not once per signal
+        gnss_s = self.gnss_s
+        corrSource_get = self.nav_sig_corrSource.get
+        qualityInd_get = self.qualityInd.get
+        ionoModel_get = self.nav_sig_ionoModel.get
+        health_get = self.health.get
+        sigFlags = self.nav_sig_sigFlags
+
+        # one template, and one format, per signal
+        sig_fmt = ('   gnssId %u svId %u sigId %u freqId %u prRes %d cno %u '
+                   'qualityInd %u\n'
+                   '    corrSource %u ionoModel %u sigFlags %#x reserved2 %u')
+        if verbose:
+            sig_fmt += ("\n      (%s) corrSource (%s)"
+                        "\n      qualityInd (%s)"
+                        "\n      ionoModel (%s) health (%s)"
+                        "\n      sigFlags (%s)")
+
+        unpack_sig = self.nav_sig_sig_struct.unpack_from
+        for offset in range(8, 8 + (u[2] * 16), 16):
+            u = unpack_sig(buf, offset)
+            if verbose:
+                u += (gnss_s(u[0], u[1], u[2]),
+                      corrSource_get(u[7], "Unk"),
+                      qualityInd_get(u[6], "Unk"),
+                      ionoModel_get(u[8], "Unk"),
+                      health_get(u[9] & 3, "Unk"),
+                      # flag_s(), inlined
+                      ' '.join([name for bit, name in sigFlags
+                                if bit == bit & u[9]]))
+            s.append(sig_fmt % u)
+        return '\n'.join(s)
 
     nav_slas_flags = {
         1: "gmsAvailable",
@@ -5543,22 +5569,28 @@ High Precision GNSS products only."""
         4: "testMode",
         }
 
+    nav_slas_struct = struct.Struct('<LBBBBllBBBB')
+    nav_slas_sv_struct = struct.Struct('<BBLh')
+
     def nav_slas(self, buf):
         """UBX-NAV-SLAS decode, QZSS L1S SLAS Status Data"""
 
-        u = struct.unpack_from('<LBBBBllBBBB', buf, 0)
-        s = ('  iTOW %u version %u reserved1 %u %u %u'
+        verbose = gps.VERB_DECODE <= self.verbosity
+
+        u = self.nav_slas_struct.unpack_from(buf, 0)
+        s = ['  iTOW %u version %u reserved1 %u %u %u'
              '  gmsLon %d gmsLon %d gmsCode %u qzssSvId %u'
-             '  serviceFlags x%x cnt %d' % u)
+             '  serviceFlags x%x cnt %d' % u]
 
-        for i in range(0, u[8]):
-            u = struct.unpack_from('<BBLh', buf, 20 + (i * 8))
-            s += '\n   gnssId %u svId %u reserved23 %u prc %d ' % u
+        unpack_sv = self.nav_slas_sv_struct.unpack_from
+        for offset in range(20, 20 + (u[8] * 8), 8):
+            u = unpack_sv(buf, offset)
+            s.append('   gnssId %u svId %u reserved23 %u prc %d ' % u)
 
-            if gps.VERB_DECODE <= self.verbosity:
-                s += ("\n     flags (%s)" %
-                      (flag_s(u[3], self.nav_slas_flags)))
-        return s
+            if verbose:
+                s.append("     flags (%s)" %
+                         (flag_s(u[3], self.nav_slas_flags)))
+        return '\n'.join(s)
 
     nav_sol_flags = {
         1: "GPSfixOK",
@@ -5567,13 +5599,15 @@ High Precision GNSS products only."""
         8: "TOWSET",
         }
 
+    nav_sol_struct = struct.Struct('<LlhBBlllLlllLHBBL')
+
     def nav_sol(self, buf):
         """UBX-NAV-SOL decode, Navigation Solution Information"""
 
         # removed from protVer 34 and up
         # deprecated by u-blox
 
-        u = struct.unpack_from('<LlhBBlllLlllLHBBL', buf, 0)
+        u = self.nav_sol_struct.unpack_from(buf, 0)
         s = ('  iTOW %u fTOW %d week %d gpsFix %u flags x%x\n'
              '  ECEF X %d Y %d Z %d pAcc %u\n'
              '  VECEF X %d Y %d Z %d sAcc %u\n'
@@ -5581,7 +5615,7 @@ High Precision GNSS products only."""
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   gpsfix (%s)"
                   "\n   flags (%s)" %
-                  (index_s(u[3], self.nav_pvt_fixType),
+                  (self.nav_pvt_fixType.get(u[3], "Unk"),
                    flag_s(u[4], self.nav_sol_flags)))
 
         return s
@@ -5612,31 +5646,38 @@ High Precision GNSS products only."""
         3: "Multiple Indicated",
         }
 
+    nav_status_struct = struct.Struct('<LBBBBLL')
+
     def nav_status(self, buf):
         """UBX-NAV-STATUS decode"""
 
-        u = struct.unpack_from('<LBBBBLL', buf, 0)
+        u = self.nav_status_struct.unpack_from(buf, 0)
         s = ('  iTOW %d gpsFix %d flags %#x fixStat %#x flags2 %#x\n'
              '  ttff %d, msss %d' % u)
         if gps.VERB_DECODE <= self.verbosity:
+            fixStat = u[3]
+            flags2 = u[4]
             s += ("\n   gpsfix (%s)"
                   "\n   flags (%s)"
                   "\n   fixStat (%s) mapMatching (%s)"
                   "\n   flags2 (psmState %s spoofDetState %s carrSoln %s)" %
-                  (index_s(u[1], self.nav_pvt_fixType),
+                  (self.nav_pvt_fixType.get(u[1], "Unk"),
                    flag_s(u[2], self.nav_sol_flags),
-                   flag_s(0x3f & u[3], self.nav_status_fixStat),
-                   index_s(0xc0 & u[3], self.nav_status_mapMatching),
-                   index_s(3 & u[4], self.nav_status_psmState),
-                   index_s(3 & (u[4] >> 3), self.nav_status_spoofDetState),
-                   index_s(3 & (u[4] >> 6), self.carrSoln)))
+                   flag_s(0x3f & fixStat, self.nav_status_fixStat),
+                   self.nav_status_mapMatching.get(0xc0 & fixStat, "Unk"),
+                   self.nav_status_psmState.get(3 & flags2, "Unk"),
+                   self.nav_status_spoofDetState.get(3 & (flags2 >> 3),
+                                                     "Unk"),
+                   self.carrSoln.get(3 & (flags2 >> 6), "Unk")))
         return s
 
+    nav_svin_struct = struct.Struct('<BBBBLLlllbbbBLLBB')
+
     def nav_svin(self, buf):
         """UBX-NAV-SVIN decode, Survey-in data"""
 
         # in M8 HPG only
-        u = struct.unpack_from('<BBBBLLlllbbbBLLBB', buf, 0)
+        u = self.nav_svin_struct.unpack_from(buf, 0)
         return ('  version %u reserved1[%u %u %u] iTOW %u dur %u\n'
                 '  meanX %d meanY %d meanZ %d\n'
                 '  meanXHP %d meanYHP %d meanZHP %d reserved2 %u meanAcc %u\n'
@@ -5672,33 +5713,34 @@ High Precision GNSS products only."""
         7: 'code and carrier locked, time synced',
         }
 
+    nav_svinfo_struct = struct.Struct('<LbbH')
+    nav_svinfo_sv_struct = struct.Struct('<BBBBBbhl')
+
     def nav_svinfo(self, buf):
         """UBX-NAV-SVINFO decode"""
 
+        verbose = gps.VERB_DECODE <= self.verbosity
+
         # removed from protVer 34 and up
         # in M8 Timing and FTS only
-        m_len = len(buf)
+        u = self.nav_svinfo_struct.unpack_from(buf, 0)
+        s = [' iTOW:%d numCh %d globalFlags %d reserved1 x%x' % u]
+        if verbose:
+            s.append('  globalFlags (%s)' %
+                     self.nav_svinfo_gflags.get(u[2], "Unk"))
+
+        unpack_sv = self.nav_svinfo_sv_struct.unpack_from
+        for offset in range(8, len(buf), 12):
+            u = unpack_sv(buf, offset)
+            s.append('  chn %3d svid %3d flags %#0.2x quality %u cno %2d'
+                     ' elev %3d azim %3d prRes %6d' % u)
+            if verbose:
+                s.append('   flags (%s)'
+                         '\n   quality (%s)' %
+                         (flag_s(u[2], self.nav_svinfo_flags),
+                          self.nav_svinfo_quality.get(u[3], "Unk")))
 
-        u = struct.unpack_from('<LbbH', buf, 0)
-        s = ' iTOW:%d numCh %d globalFlags %d reserved1 x%x' % u
-        if gps.VERB_DECODE <= self.verbosity:
-            s += '\n  globalFlags (%s)' % index_s(u[2], self.nav_svinfo_gflags)
-
-        m_len -= 8
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<BBBBBbhl', buf, 8 + i * 12)
-            s += ('\n  chn %3d svid %3d flags %#0.2x quality %u cno %2d'
-                  ' elev %3d azim %3d prRes %6d' % u)
-            if gps.VERB_DECODE <= self.verbosity:
-                s += ('\n   flags (%s)'
-                      '\n   quality (%s)' %
-                      (flag_s(u[2], self.nav_svinfo_flags),
-                       index_s(u[3], self.nav_svinfo_quality)))
-            m_len -= 12
-            i += 1
-
-        return s
+        return '\n'.join(s)
 
     nav_time_valid = {
         1: "towValid",
@@ -5706,51 +5748,59 @@ High Precision GNSS products only."""
         4: "leapValid",
         }
 
+    # flag_s() of every possible valid byte, built once
+    nav_time_valid_s = tuple(map(flag_s, range(256), (nav_time_valid,) * 256))
+
+    # shared by NAV-TIMEBDS, NAV-TIMEGAL, NAV-TIMEGLO and NAV-TIMEQZSS
+    nav_time_struct = struct.Struct('<LLlhbBL')
+
     def nav_timebds(self, buf):
         """UBX-NAV-TIMEBDS decode"""
 
-        u = struct.unpack_from('<LLlhbBL', buf, 0)
+        u = self.nav_time_struct.unpack_from(buf, 0)
         s = ("  iTOW %d SOW %d fSOW %d week %d leapS %d\n"
              "  Valid %#x tAcc %d" % u)
 
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   valid (%s)" %
-                  (flag_s(u[5], self.nav_time_valid)))
+                  self.nav_time_valid_s[u[5]])
         return s
 
     def nav_timegal(self, buf):
         """UBX-NAV-TIMEGAL decode"""
 
-        u = struct.unpack_from('<LLlhbBL', buf, 0)
+        u = self.nav_time_struct.unpack_from(buf, 0)
         s = ("  iTOW %d galTOW %d fGalTow %d galWno %d leapS %d\n"
              "  Valid x%x, tAcc %d" % u)
 
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   valid (%s)" %
-                  (flag_s(u[5], self.nav_time_valid)))
+                  self.nav_time_valid_s[u[5]])
         return s
 
     def nav_timeglo(self, buf):
         """UBX-NAV-TIMEGLO decode"""
 
-        u = struct.unpack_from('<LLlhbBL', buf, 0)
+        u = self.nav_time_struct.unpack_from(buf, 0)
         s = ("  iTOW %d TOD %d fTOD %d Nt %d  N4 %d\n"
              "  Valid x%x tAcc %d" % u)
 
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   valid (%s)" %
-                  (flag_s(u[5], self.nav_time_valid)))
+                  self.nav_time_valid_s[u[5]])
         return s
 
+    nav_timegps_struct = struct.Struct('<LlhbBL')
+
     def nav_timegps(self, buf):
         """UBX-NAV-TIMEGPS decode"""
 
-        u = struct.unpack_from('<LlhbBL', buf, 0)
+        u = self.nav_timegps_struct.unpack_from(buf, 0)
         s = "  iTOW %u fTOW %u week %d leapS %d valid x%x tAcc %d" % u
 
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   valid (%s)" %
-                  (flag_s(u[4], self.nav_time_valid)))
+                  self.nav_time_valid_s[u[4]])
         return s
 
     nav_timels_src = {
@@ -5778,10 +5828,12 @@ High Precision GNSS products only."""
         2: "validTimeToLsEvent",
         }
 
+    nav_timels_struct = struct.Struct('<LBBBBBbBblHHBBBB')
+
     def nav_timels(self, buf):
         """UBX-NAV-TIMELS decode, Leap second event information"""
 
-        u = struct.unpack_from('<LBBBBBbBblHHBBBB', buf, 0)
+        u = self.nav_timels_struct.unpack_from(buf, 0)
         s = ('  iTOW %u version %u reserved2 %u %u %u srcOfCurrLs %u\n'
              '  currLs %d srcOfLsChange %u lsChange %d timeToLsEvent %d\n'
              '  dateOfLsGpsWn %u dateOfLsGpsDn %u reserved2 %u %u %u\n'
@@ -5789,8 +5841,8 @@ High Precision GNSS products only."""
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   srcOfCurrLs (%s) srcOfLsChange (%s)"
                   "\n   valid (%s)" %
-                  (index_s(u[5], self.nav_timels_src),
-                   index_s(u[7], self.nav_timels_src1),
+                  (self.nav_timels_src.get(u[5], "Unk"),
+                   self.nav_timels_src1.get(u[7], "Unk"),
                    flag_s(u[15], self.nav_timels_valid)))
         return s
 
@@ -5806,7 +5858,7 @@ High Precision GNSS products only."""
 protVer 34 and up
 """
 
-        u = struct.unpack_from('<LLlhbBL', buf, 0)
+        u = self.nav_time_struct.unpack_from(buf, 0)
         s = ("  iTOW %u qzssTow %u fQzssTow %d qzssWno %d leapS %d\n"
              "  valid x%x tAcc %d" % u)
 
@@ -5821,31 +5873,37 @@ protVer 34 and up
         4: "validUTC",
         }
 
+    nav_timeutc_struct = struct.Struct('<LLlHbbbbbB')
+
     def nav_timeutc(self, buf):
         """UBX-NAV-TIMEUTC decode"""
 
-        u = struct.unpack_from('<LLlHbbbbbB', buf, 0)
+        u = self.nav_timeutc_struct.unpack_from(buf, 0)
         s = ("  iTOW %u tAcc %u nano %d Time  %4u/%02u/%02u %02u:%02u:%02u\n"
              "  valid x%x" % u)
 
         if gps.VERB_DECODE <= self.verbosity:
             s += ("\n   valid (%s) utcStandard (%s)" %
                   (flag_s(u[9], self.nav_timeutc_valid),
-                   index_s(u[9] >> 4, self.utc_std)))
+                   self.utc_std.get(u[9] >> 4, "Unk")))
         return s
 
+    nav_velecef_struct = struct.Struct('<LlllL')
+
     def nav_velecef(self, buf):
         """UBX-NAV-VELECEF decode"""
 
         # protVer 4+
-        u = struct.unpack_from('<LlllL', buf, 0)
+        u = self.nav_velecef_struct.unpack_from(buf, 0)
         return '  iTOW %d ecef: VX %d VY %d VZ %d vAcc:%u' % u
 
+    nav_velned_struct = struct.Struct('<LlllLLlLL')
+
     def nav_velned(self, buf):
         """UBX-NAV-VELNED decode."""
 
         # protVer 15+
-        u = struct.unpack_from('<LlllLLlLL', buf, 0)
+        u = self.nav_velned_struct.unpack_from(buf, 0)
         return ('  iTOW %u vel: N %d E %d D %d speed %u\n'
                 '  gspeed %u heading %d sAcc %u cAcc %u' % u)
 
@@ -5968,43 +6026,48 @@ protVer 34 and up
                 0x45: {'str': 'GAQ'},
                 }
 
+    rxm_imes_struct = struct.Struct('<BBH')
+    rxm_imes_tx_struct = struct.Struct('<BBHBBHlLLLllLLL')
+
     def rxm_imes(self, buf):
         """UBX-RXM-IMES decode, Indoor Messaging System Information"""
 
         # not supported in M1
-        u = struct.unpack_from('<BBH', buf, 0)
-        s = ' numTx %u version %u reserved1 %u' % u
+        u = self.rxm_imes_struct.unpack_from(buf, 0)
+        s = [' numTx %u version %u reserved1 %u' % u]
 
         for i in range(0, u[0]):
-            u = struct.unpack_from('<BBHBBHlLLLllLLL', buf, 4 + (i * 44))
-            s += ('\n  reserved %u txId %u reserved3 %u %u cno %u reserved4 %u'
-                  '\n doppler %d position1_1 x%x position1_2 x%x'
-                  '\n position2_1 x%x lat %d lon %d shortIdFrame x%x'
-                  '\n mediumIdLSB %u mediumId_2 x%x' % u)
+            u = self.rxm_imes_tx_struct.unpack_from(buf, 4 + (i * 44))
+            s.append('  reserved %u txId %u reserved3 %u %u cno %u '
+                     'reserved4 %u'
+                     '\n doppler %d position1_1 x%x position1_2 x%x'
+                     '\n position2_1 x%x lat %d lon %d shortIdFrame x%x'
+                     '\n mediumIdLSB %u mediumId_2 x%x' % u)
 
-        return s
+        return '\n'.join(s)
+
+    rxm_measx_struct = struct.Struct('<BBBBLLLLLHHHHHBBLL')
+    rxm_measx_sv_struct = struct.Struct('<BBBBllHHLBBH')
 
     def rxm_measx(self, buf):
         """UBX-RXM-RAW decode"""
-        m_len = len(buf)
 
-        u = struct.unpack_from('<BBBBLLLLLHHHHHBBLL', buf, 0)
-        s = (' version %u reserved1 %u %u %u gpsTOW %u gloTOW %u\n'
+        u = self.rxm_measx_struct.unpack_from(buf, 0)
+        s = [' version %u reserved1 %u %u %u gpsTOW %u gloTOW %u\n'
              ' bdsTOW %u reserved2 %u qzssTOW %u gpsTOWacc %u\n'
              ' gloTOWacc %u bdsTOWacc %u reserved3 %u qzssTOWacc %u\n'
-             ' numSV %u flags %#x reserved4 %u %u' % u)
-
-        m_len -= 44
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<BBBBllHHLBBH', buf, 44 + i * 24)
-            s += ('\n  gnssId %u svId %u cNo %u mpathIndic %u DopplerMS %d\n'
-                  '    dopplerHz %d wholeChips %u fracChips %u codephase %u\n'
-                  '    intCodePhase %u pseudoRangeRMSErr %u reserved5 %u' % u)
-            m_len -= 24
-            i += 1
+             ' numSV %u flags %#x reserved4 %u %u' % u]
 
-        return s
+        unpack_sv = self.rxm_measx_sv_struct.unpack_from
+        for offset in range(44, len(buf), 24):
+            u = unpack_sv(buf, offset)
+            s.append('  gnssId %u svId %u cNo %u mpathIndic %u DopplerMS %d\n'
+                     '    dopplerHz %d wholeChips %u fracChips %u '
+                     'codephase %u\n'
+                     '    intCodePhase %u pseudoRangeRMSErr %u reserved5 %u'
+                     % u)
+
+        return '\n'.join(s)
 
     rxm_pmreq_flags = {
         1: "backup",
@@ -6018,6 +6081,36 @@ protVer 34 and up
         0x40: "spics",
         }
 
+    rxm_pmreq_short_struct = struct.Struct('<LL')
+    rxm_pmreq_long_struct = struct.Struct('<BBHLLL')
+
+    def _rxm_pmreq_short(self, buf):
+        """UBX-RXM-PMREQ decode, short poll"""
+
+        u = self.rxm_pmreq_short_struct.unpack_from(buf, 0)
+        s = ' duration %u flags %u' % u
+        if gps.VERB_DECODE < self.verbosity:
+            s += '\n flags (%s)' % flag_s(u[1], self.rxm_pmreq_flags)
+        return s
+
+    def _rxm_pmreq_long(self, buf):
+        """UBX-RXM-PMREQ decode, long poll"""
+
+        u = self.rxm_pmreq_long_struct.unpack_from(buf, 0)
+        s = (' version %u reserved %u %u duration %u flags x%x\n'
+             ' wakeupSources x%x' % u)
+        if gps.VERB_DECODE < self.verbosity:
+            s += ('\n flags (%s) wakeupSources (%s)' %
+                  (flag_s(u[4], self.rxm_pmreq_flags),
+                   flag_s(u[5], self.rxm_pmreq_wakeup)))
+        return s
+
+    # UBX-RXM-PMREQ decoders, by payload length
+    rxm_pmreq_len = {
+        8: _rxm_pmreq_short,
+        16: _rxm_pmreq_long,
+        }
+
     def rxm_pmreq(self, buf):
         """UBX-RXM-PMREQ decode Power management request
 
@@ -6025,90 +6118,90 @@ protVer 34 and up
 """
 
         m_len = len(buf)
-        if 4 == m_len:
-            # short poll
-            u = struct.unpack_from('<Ll', buf, 0)
-            s = ' duration %u flags %u' % u
-            if gps.VERB_DECODE < self.verbosity:
-                s += '\n flags (%s)' % flag_s(u[1], self.rxm_pmreq_flags)
-        elif 16 == m_len:
-            # long  poll
-            u = struct.unpack_from('<BBHLLL', buf, 0)
-            s = (' version %u reserved %u %u duration %u flags x%x\n'
-                 ' wakeupSources x%x' % u)
-            if gps.VERB_DECODE < self.verbosity:
-                s += ('\n flags (%s) wakeupSources (s)' %
-                      (flag_s(u[4], self.rxm_pmreq_flags),
-                       flag_s(u[5], self.rxm_pmreq_wakeup)))
-        else:
-            s = "  Bad Length %s" % m_len
-        return s
+        dec = self.rxm_pmreq_len.get(m_len)
+        if dec is None:
+            return "  Bad Length %s" % m_len
+        return dec(self, buf)
+
+    rxm_raw_struct = struct.Struct('<lhBB')
+    rxm_raw_sv_struct = struct.Struct('<ddfBbbB')
 
     def rxm_raw(self, buf):
         """UBX-RXM-RAW decode"""
-        m_len = len(buf)
 
-        u = struct.unpack_from('<lhBB', buf, 0)
-        s = ' iTOW %d weeks %d numSV %u res1 %u' % u
+        u = self.rxm_raw_struct.unpack_from(buf, 0)
+        s = [' iTOW %d weeks %d numSV %u res1 %u' % u]
 
-        m_len -= 8
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<ddfBbbB', buf, 8 + i * 24)
-            s += ('\n  cpMes %f prMes %f doMes %f sv %d mesQI %d\n'
-                  '     eno %d lli %d' % u)
-            m_len -= 24
-            i += 1
+        unpack_sv = self.rxm_raw_sv_struct.unpack_from
+        for offset in range(8, len(buf), 24):
+            u = unpack_sv(buf, offset)
+            s.append('  cpMes %f prMes %f doMes %f sv %d mesQI %d\n'
+                     '     eno %d lli %d' % u)
 
-        return s
+        return '\n'.join(s)
 
     rxm_rawx_recs = {
         1: "leapSec",
         2: "clkReset",
         }
 
+    # flag_s() of every possible recStat byte, built once
+    rxm_rawx_recs_s = tuple(map(flag_s, range(256), (rxm_rawx_recs,) * 256))
+
+    rxm_rawx_struct = struct.Struct('<dHbBBBBB')
+    rxm_rawx_meas_struct = struct.Struct('<ddfBBBBHBBBBB')
+
     def rxm_rawx(self, buf):
         """UBX-RXM-RAWX decode"""
-        m_len = len(buf)
+
+        verbose = gps.VERB_DECODE < self.verbosity
 
         # version not here before protver 18, I hope it is zero.
-        u = struct.unpack_from('<dHbBBBBB', buf, 0)
-        s = (' rcvTow %.3f week %u leapS %d numMeas %u recStat %#x'
+        u = self.rxm_rawx_struct.unpack_from(buf, 0)
+        s = [' rcvTow %.3f week %u leapS %d numMeas %u recStat %#x'
              ' version %u\n'
-             ' reserved1[2] %#x %#x\n  recStat (' % u)
-        s += flag_s(u[4], self.rxm_rawx_recs) + ')'
-
-        m_len -= 16
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<ddfBBBBHBBBBB', buf, 16 + i * 32)
-            s += ('\n  prmes %.3f cpMes %.3f doMes %f\n'
-                  '   gnssId %u svId %u sigId %u freqId %u locktime %u '
-                  'cno %u\n'
-                  '   prStdev %u cpStdev %u doStdev %u trkStat %u' % u)
-
-            if gps.VERB_DECODE < self.verbosity:
-                s += '\n      (%s)' % self.gnss_s(u[3], u[4], u[5])
-
-            m_len -= 32
-            i += 1
-        return s
+             ' reserved1[2] %#x %#x\n  recStat (%s)' %
+             (u + (self.rxm_rawx_recs_s[u[4]],))]
+
+        # one template, and one format, per measurement
+        meas_fmt = ('  prmes %.3f cpMes %.3f doMes %f\n'
+                    '   gnssId %u svId %u sigId %u freqId %u locktime %u '
+                    'cno %u\n'
+                    '   prStdev %u cpStdev %u doStdev %u trkStat %u')
+        if verbose:
+            meas_fmt += '\n      (%s)'
+
+        unpack_meas = self.rxm_rawx_meas_struct.unpack_from
+        if verbose:
+            gnss_s = self.gnss_s
+            for offset in range(16, len(buf), 32):
+                u = unpack_meas(buf, offset)
+                s.append(meas_fmt % (u + (gnss_s(u[3], u[4], u[5]),)))
+        else:
+            # fast path, nothing to add per measurement
+            s.extend([meas_fmt % unpack_meas(buf, offset)
+                      for offset in range(16, len(buf), 32)])
+        return '\n'.join(s)
+
+    rxm_rlm_struct = struct.Struct('<BBBBLLB')
+    rxm_rlm_short_struct = struct.Struct('<BBB')
+    rxm_rlm_long_struct = struct.Struct('<BBBBBBBBBBBBBBB')
 
     def rxm_rlm(self, buf):
         """UBX-RXM-RLM decode, Galileo SAR RLM report"""
         m_len = len(buf)
 
         # common to Short-RLM and Long-RLM report
-        u = struct.unpack_from('<BBBBLLB', buf, 0)
+        u = self.rxm_rlm_struct.unpack_from(buf, 0)
         s = ("  version %u type %u svId %u reserved1 %u beacon x%x %x "
              " message %u" % u)
         if 16 == m_len:
             # Short-RLM report
-            u = struct.unpack_from('<BBB', buf, 13)
+            u = self.rxm_rlm_short_struct.unpack_from(buf, 13)
             s += "\n  params %u %u reserved2 %u" % u
         elif 28 == m_len:
             # Long-RLM report
-            u = struct.unpack_from('<BBBBBBBBBBBBBBB', buf, 13)
+            u = self.rxm_rlm_long_struct.unpack_from(buf, 13)
             s += ("\n  params %u %u %u %u %u %u %u %u %u %u %u %u"
                   "\n  reserved2 %u %u %u" % u)
 
@@ -6118,21 +6211,28 @@ protVer 34 and up
         1: "crcFailed",
         }
 
+    # flag_s() of every possible flags byte, built once
+    rxm_rtcm_flags_s = tuple(map(flag_s, range(256), (rxm_rtcm_flags,) * 256))
+
+    rxm_rtcm_struct = struct.Struct('<BBHHH')
+
     def rxm_rtcm(self, buf):
         """UBX-RXM-RTCM decode, RTCM Input Status"""
 
         # present in some u-blox 8 and 9, protVer 20+
         # undocumented, but in NEO-M9N, protVer 32
-        u = struct.unpack_from('<BBHHH', buf, 0)
+        u = self.rxm_rtcm_struct.unpack_from(buf, 0)
         s = "  version %u flags x%x subtype %u refstation %u msgtype %u" % u
         if gps.VERB_DECODE <= self.verbosity:
-            s += ('\n    flags (%s)' % flag_s(u[1], self.rxm_rtcm_flags))
+            s += '\n    flags (%s)' % self.rxm_rtcm_flags_s[u[1]]
         return s
 
+    rxm_sfrb_struct = struct.Struct('<BBLLLLLLLLLL')
+
     def rxm_sfrb(self, buf):
         """UBX-RXM-SFRB decode, Subframe Buffer"""
 
-        u = struct.unpack_from('<BBLLLLLLLLLL', buf, 0)
+        u = self.rxm_sfrb_struct.unpack_from(buf, 0)
         s = ('  chn %d s svid %3d\n'
              '  dwrd %08x %08x %08x %08x %08x\n'
              '       %08x %08x %08x %08x %08x' % u)
@@ -6175,6 +6275,208 @@ protVer 34 and up
                unpack_s11(words[9], 11) * (2 ** -38)))
         return s
 
+    def _decode_sfrbx_bds1(self, FraID, SOW, page, words):
+        """Decode BeiDou D1 subframe 1"""
+
+        SatH1 = (page >> 257) & 1
+        AODC = (page >> 252) & 0x01f
+        URAI = (page >> 248) & 0x0f
+        WN = (page >> 227) & 0x01fff
+        t0c = ((page >> 218) & 0x01ff) << 8
+        t0c |= (page >> 202) & 0x0ff
+        TGD1 = (page >> 192) & 0x3ff
+        TGD2 = ((page >> 188) & 0x0f) << 6
+        TGD2 |= (page >> 174) & 0x03f
+        alpha0 = (page >> 166) & 0x0ff
+        alpha1 = (page >> 158) & 0x0ff
+        alpha2 = (page >> 142) & 0x0ff
+        alpha3 = (page >> 134) & 0x0ff
+        beta0 = ((page >> 128) & 0x03f) << 2
+        beta0 |= (page >> 118) & 3
+        beta1 = (page >> 110) & 0x0ff
+        beta2 = (page >> 102) & 0x0ff
+        beta3 = ((page >> 98) & 0x0f) << 4
+        beta3 |= (page >> 86) & 0x0f
+        a2 = (page >> 75) & 0x07ff
+        a0 = ((page >> 68) & 0x07f) << 17
+        a0 |= (page >> 43) & 0x01ffff
+        a1 = ((page >> 38) & 0x01f) << 17
+        a1 |= (page >> 13) & 0x01ffff
+        AODE = (page >> 8) & 0x01f
+        return ("\n    SatH1 %u AODC %u URAI %u WN %u t0c %u TGD1 %u "
+                "TGD2 %u"
+                "\n      alpha0 %u alpha1 %u alpha2 %u alpha3 %u"
+                "\n      beta0 %u beta1 %u beta2 %u beta3 %u"
+                "\n      a2 %u a0 %u a1 %u AODE %u" %
+                (SatH1, AODC, URAI, WN, t0c, TGD1, TGD2, alpha0, alpha1,
+                 alpha2, alpha3, beta0, beta1, beta2, beta3,
+                 a2, a0, a1, AODE))
+
+    def _decode_sfrbx_bds2(self, FraID, SOW, page, words):
+        """Decode BeiDou D1 subframe 2"""
+
+        deltan = ((page >> 248) & 0x03ff) << 6
+        deltan |= (page >> 234) & 0x03f
+        Cuc = ((page >> 218) & 0x0ffff) << 2
+        Cuc |= (page >> 210) & 3
+        M0 = ((page >> 188) & 0x0fffff) << 12
+        M0 |= (page >> 168) & 0x0fff
+        e = ((page >> 158) & 0x03ff) << 22
+        e |= (page >> 128) & 0x03fffff
+        Cus = (page >> 102) & 0x03ffff
+        Crc = ((page >> 98) & 0x0f) << 14
+        Crc |= (page >> 76) & 0x03fff
+        Crs = ((page >> 68) & 0x0f) << 10
+        Crs |= (page >> 50) & 0x03ff
+        sqrtA = ((page >> 38) & 0x0fff) << 20
+        sqrtA |= (page >> 10) & 0x0fffff
+        toeMSB = (page >> 8) & 3
+        return ("\n    deltan %u Cuc %u M0 %u e %u Cus %u Crc %u"
+                "\n    Crs %u sqrtA %u toeMSB %u" %
+                (deltan, Cuc, M0, e, Cus, Crc, Crs, sqrtA, toeMSB))
+
+    def _decode_sfrbx_bds3(self, FraID, SOW, page, words):
+        """Decode BeiDou D1 subframe 3"""
+
+        toeLSB = ((page >> 248) & 0x03ff) << 5
+        toeLSB |= (page >> 235) & 0x01f
+        i0 = ((page >> 218) & 0x01ffff) << 15
+        i0 |= (page >> 195) & 0x07fff
+        Cic = ((page >> 188) & 0x07f) << 11
+        Cic |= (page >> 137) & 0x07fff
+        Omegadot = ((page >> 158) & 0x07ff) << 13
+        Omegadot |= (page >> 137) & 0x01fff
+        Cis = ((page >> 128) & 0x01ff) << 9
+        Cis |= (page >> 111) & 0x01ff
+        IDOT = ((page >> 98) & 0x01fff) << 1
+        IDOT |= (page >> 49) & 1
+        Omega0 = ((page >> 68) & 0x01fffff) << 11
+        Omega0 |= (page >> 49) & 0x07ff
+        omega = ((page >> 38) & 0x07ff) << 21
+        omega |= (page >> 9) & 0x01fffff
+        Rev = (page >> 8) & 1
+        return ("\n    toeLSB %u i0 %u Cic %u Omegadot %u Cis %u"
+                "\n    IDOT %u Omega0 %u omega %u Rev %u" %
+                (toeLSB, i0, Cic, Omegadot, Cis, IDOT, Omega0, omega, Rev))
+
+    def _decode_sfrbx_bds45(self, FraID, SOW, page, words):
+        """Decode BeiDou D1 subframes 4 and 5"""
+
+        Pnum = (page >> 250) & 0x07f
+        s = "\n    Pnum %u: " % Pnum
+        if (((4 == FraID and (1 <= Pnum <= 24)) or
+             (1 <= Pnum <= 6) or
+             (11 <= Pnum <= 23))):
+            # Subfram 4, page 1 to 24: Almanac
+            # Subfram 5, page 1 to 6: Almanac
+            # Subfram 5, page 11 to 23: maybe Almanac
+            AmEpID = (page >> 8) & 3
+            if 3 != AmEpID:
+                # not Almanac
+                s += "Reserved AmEpID %u" % AmEpID
+            else:
+                sqrtA = ((page >> 248) & 3) << 22
+                sqrtA |= (page >> 218) & 0x03fffff
+                a1 = (page >> 199) & 0x07ff
+                a0 = (page >> 188) & 0x07ff
+                Omega0 = ((page >> 158) & 0x3fffff) << 2
+                Omega0 |= (page >> 148) & 3
+                e = (page >> 131) & 0x01ffff
+                deltai = ((page >> 128) & 3) << 13
+                deltai |= (page >> 107) & 0x01ffff
+                t0a = (page >> 99) & 0x0ff
+                Omegadot = ((page >> 98) & 1) << 16
+                Omegadot |= (page >> 74) & 0x0ffff
+                omega = ((page >> 68) & 0x03f) << 18
+                omega |= (page >> 42) & 0x03ffff
+                M0 = ((page >> 38) & 0x0f) << 20
+                M0 |= (page >> 10) & 0x0fffff
+                s += ("Almanac; sqrtA %u a1 %u a0 %u Omega0 %u"
+                      "\n         e %u deltai %u t0a %u Omegadot %u"
+                      "\n         omega %u M0 %u AmEpID %u" %
+                      (sqrtA, a1, a0, Omega0, e, deltai, t0a, Omegadot,
+                       omega, M0, AmEpID))
+        elif 5 == FraID:
+            if Pnum in (7, 8, 24):
+                # make a packed integer
+                hlth = 0
+                for i in range(0, 10):
+                    # remove top two random bits and last 8 bits parity
+                    hlth = (hlth << 22) | ((words[i] & 0x3fffffff) >> 8)
+
+            if 7 == Pnum:
+                s += "Health 1 to 19:\n   "
+                # remove 7 reserved bits from last word
+                hlth >>= 7
+                # take 9 bits at a time from the top
+                s += ''.join([" %3x" % ((hlth >> ((19 - i) * 9)) & 0x1ff)
+                              for i in range(1, 20)])
+            elif 8 == Pnum:
+                # remove 63 reserved bits from LSBs
+                hlth >>= 63
+                WNa = (hlth >> 8) & 0x0ff
+                t0a = hlth & 0x0ff
+                # Hea20 to Hea30 now in the LSB
+                hlth >>= 16
+                s += "Health 20 to 30 WNa %u t0a %u\n       " % (WNa, t0a)
+                # take 9 bits at a time from the top
+                s += ''.join([" %3x" % ((hlth >> ((30 - i) * 9)) & 0x1ff)
+                              for i in range(20, 31)])
+            elif 9 == Pnum:
+                A0GPS = (page >> 106) & 0x03fff
+                A1GPS = ((page >> 188) & 0x03) << 14
+                A1GPS |= (page >> 166) & 0x03fff
+                A0GAL = ((page >> 158) & 0x0ff) << 6
+                A0GAL |= (page >> 144) & 0x03f
+                A1GAL = (page >> 128) & 0x0ffff
+                A0GLO = (page >> 106) & 0x03fff
+                A1GLO = ((page >> 98) & 0x0f) << 8
+                A1GLO |= (page >> 82) & 0x0f
+                s += ("Timing A0GPS %u A1GPS %u A0GAL %u A1GAL %u"
+                      "\n       A0GLO %u A1GLO %u" %
+                      (A0GPS, A1GPS, A0GAL, A1GAL, A0GLO, A1GLO))
+            elif 10 == Pnum:
+                deltatLS = ((page >> 248) & 0x03) << 6
+                deltatLS |= (page >> 234) & 0x03f
+                deltatLSF = (page >> 226) & 0x0ff
+                WNLSF = (page >> 218) & 0x0ff
+                A0UTC = ((page >> 188) & 0x03fffff) << 10
+                A0UTC |= (page >> 170) & 0x03ff
+                A1UTC = ((page >> 158) & 0x0fff) << 12
+                A1UTC |= (page >> 138) & 0x0fff
+                DN = (page >> 130) & 0x0ff
+                s += ("Timing: deltatLS %u deltatLSF %u WNLSF %u A0UTC %u"
+                      " A1UTC %u" %
+                      (deltatLS, deltatLSF, WNLSF, A0UTC, A1UTC))
+            elif 24 == Pnum:
+                # ICD calls this AmID and AmEpID
+                AmEpID = (page >> 83) & 3
+                if 3 != AmEpID:
+                    # not Almanac
+                    s += "Reserved AmEpID %u" % AmEpID
+                else:
+                    s += "Health 31 to 43: AmEpID %u" % AmEpID
+                    # Hea31 to Hea43 now in the LSB
+                    hlth >>= 85
+                    s += "Health 31 to 43 t0a %u\n       " % SOW
+                    # take 9 bits at a time from the top
+                    s += ''.join([" %3x" % ((hlth >> ((43 - i) * 9)) & 0x1ff)
+                                  for i in range(31, 44)])
+            else:
+                s += "Unknown page number"
+        else:
+            s += "Unknown page number"
+        return s
+
+    # BeiDou D1 subframe decoders, by FraID
+    sfrbx_bds_fraid = {
+        1: _decode_sfrbx_bds1,
+        2: _decode_sfrbx_bds2,
+        3: _decode_sfrbx_bds3,
+        4: _decode_sfrbx_bds45,
+        5: _decode_sfrbx_bds45,
+        }
+
     def _decode_sfrbx_bds(self, words):
         """Decode UBX-RXM-SFRBX BeiDou frames"""
         # See u-blox8-M8_ReceiverDescrProtSpec_UBX-13003221.pdf
@@ -6188,8 +6490,7 @@ protVer 34 and up
         # unmung u-blox 30 bit words in 32 bits
         page = 0
         for i in range(0, 10):
-            page <<= 30
-            page |= words[i] & 0x03fffffff
+            page = (page << 30) | (words[i] & 0x03fffffff)
 
         # sanity check
         if (FraID != ((page >> 282) & 7)):
@@ -6203,192 +6504,252 @@ protVer 34 and up
         SOW |= (page >> 258) & 0x0fff
         s = ("\n    BDS: Rev %u FraID %i SOW %u" %
              (Rev, FraID, SOW))
-        if 1 == FraID:
-            SatH1 = (page >> 257) & 1
-            AODC = (page >> 252) & 0x01f
-            URAI = (page >> 248) & 0x0f
-            WN = (page >> 227) & 0x01fff
-            t0c = ((page >> 218) & 0x01ff) << 8
-            t0c |= (page >> 202) & 0x0ff
-            TGD1 = (page >> 192) & 0x3ff
-            TGD2 = ((page >> 188) & 0x0f) << 6
-            TGD2 |= (page >> 174) & 0x03f
-            alpha0 = (page >> 166) & 0x0ff
-            alpha1 = (page >> 158) & 0x0ff
-            alpha2 = (page >> 142) & 0x0ff
-            alpha3 = (page >> 134) & 0x0ff
-            beta0 = ((page >> 128) & 0x03f) << 2
-            beta0 |= (page >> 118) & 3
-            beta1 = (page >> 110) & 0x0ff
-            beta2 = (page >> 102) & 0x0ff
-            beta3 = ((page >> 98) & 0x0f) << 4
-            beta3 |= (page >> 86) & 0x0f
-            a2 = (page >> 75) & 0x07ff
-            a0 = ((page >> 68) & 0x07f) << 17
-            a0 |= (page >> 43) & 0x01ffff
-            a1 = ((page >> 38) & 0x01f) << 17
-            a1 |= (page >> 13) & 0x01ffff
-            AODE = (page >> 8) & 0x01f
-            s += ("\n    SatH1 %u AODC %u URAI %u WN %u t0c %u TGD1 %u "
-                  "TGD2 %u"
-                  "\n      alpha0 %u alpha1 %u alpha2 %u alpha3 %u"
-                  "\n      beta0 %u beta1 %u beta2 %u beta3 %u"
-                  "\n      a2 %u a0 %u a1 %u AODE %u" %
-                  (SatH1, AODC, URAI, WN, t0c, TGD1, TGD2, alpha0, alpha1,
-                   alpha2, alpha3, beta0, beta1, beta2, beta3,
-                   a2, a0, a1, AODE))
-        elif 2 == FraID:
-            deltan = ((page >> 248) & 0x03ff) << 6
-            deltan |= (page >> 234) & 0x03f
-            Cuc = ((page >> 218) & 0x0ffff) << 2
-            Cuc |= (page >> 210) & 3
-            M0 = ((page >> 188) & 0x0fffff) << 12
-            M0 |= (page >> 168) & 0x0fff
-            e = ((page >> 158) & 0x03ff) << 22
-            e |= (page >> 128) & 0x03fffff
-            Cus = (page >> 102) & 0x03ffff
-            Crc = ((page >> 98) & 0x0f) << 14
-            Crc |= (page >> 76) & 0x03fff
-            Crs = ((page >> 68) & 0x0f) << 10
-            Crs |= (page >> 50) & 0x03ff
-            sqrtA = ((page >> 38) & 0x0fff) << 20
-            sqrtA |= (page >> 10) & 0x0fffff
-            toeMSB = (page >> 8) & 3
-            s += ("\n    deltan %u Cuc %u M0 %u e %u Cus %u Crc %u"
-                  "\n    Crs %u sqrtA %u toeMSB %u" %
-                  (deltan, Cuc, M0, e, Cus, Crc, Crs, sqrtA, toeMSB))
-        elif 3 == FraID:
-            toeLSB = ((page >> 248) & 0x03ff) << 5
-            toeLSB |= (page >> 235) & 0x01f
-            i0 = ((page >> 218) & 0x01ffff) << 15
-            i0 |= (page >> 195) & 0x07fff
-            Cic = ((page >> 188) & 0x07f) << 11
-            Cic |= (page >> 137) & 0x07fff
-            Omegadot = ((page >> 158) & 0x07ff) << 13
-            Omegadot |= (page >> 137) & 0x01fff
-            Cis = ((page >> 128) & 0x01ff) << 9
-            Cis |= (page >> 111) & 0x01ff
-            IDOT = ((page >> 98) & 0x01fff) << 1
-            IDOT |= (page >> 49) & 1
-            Omega0 = ((page >> 68) & 0x01fffff) << 11
-            Omega0 |= (page >> 49) & 0x07ff
-            omega = ((page >> 38) & 0x07ff) << 21
-            omega |= (page >> 9) & 0x01fffff
-            Rev = (page >> 8) & 1
-            s += ("\n    toeLSB %u i0 %u Cic %u Omegadot %u Cis %u"
-                  "\n    IDOT %u Omega0 %u omega %u Rev %u" %
-                  (toeLSB, i0, Cic, Omegadot, Cis, IDOT, Omega0, omega, Rev))
-        elif FraID in [4, 5]:
-            Pnum = (page >> 250) & 0x07f
-            s += "\n    Pnum %u: " % Pnum
-            if (((4 == FraID and (1 <= Pnum <= 24)) or
-                 (1 <= Pnum <= 6) or
-                 (11 <= Pnum <= 23))):
-                # Subfram 4, page 1 to 24: Almanac
-                # Subfram 5, page 1 to 6: Almanac
-                # Subfram 5, page 11 to 23: maybe Almanac
-                AmEpID = (page >> 8) & 3
-                if 3 != AmEpID:
-                    # not Almanac
-                    s += "Reserved AmEpID %u" % AmEpID
-                else:
-                    sqrtA = ((page >> 248) & 3) << 22
-                    sqrtA |= (page >> 218) & 0x03fffff
-                    a1 = (page >> 199) & 0x07ff
-                    a0 = (page >> 188) & 0x07ff
-                    Omega0 = ((page >> 158) & 0x3fffff) << 2
-                    Omega0 |= (page >> 148) & 3
-                    e = (page >> 131) & 0x01ffff
-                    deltai = ((page >> 128) & 3) << 13
-                    deltai |= (page >> 107) & 0x01ffff
-                    t0a = (page >> 99) & 0x0ff
-                    Omegadot = ((page >> 98) & 1) << 16
-                    Omegadot |= (page >> 74) & 0x0ffff
-                    omega = ((page >> 68) & 0x03f) << 18
-                    omega |= (page >> 42) & 0x03ffff
-                    M0 = ((page >> 38) & 0x0f) << 20
-                    M0 |= (page >> 10) & 0x0fffff
-                    s += ("Almanac; sqrtA %u a1 %u a0 %u Omega0 %u"
-                          "\n         e %u deltai %u t0a %u Omegadot %u"
-                          "\n         omega %u M0 %u AmEpID %u" %
-                          (sqrtA, a1, a0, Omega0, e, deltai, t0a, Omegadot,
-                           omega, M0, AmEpID))
-            elif 5 == FraID:
-                if Pnum in [7, 8, 24]:
-                    # make a packed integer
-                    hlth = 0
-                    for i in range(0, 10):
-                        hlth <<= 22
-                        # remove top two random bits and last 8 bits parity
-                        hlth |= (words[i] & 0x3fffffff) >> 8
-
-                if 7 == Pnum:
-                    s += "Health 1 to 19:\n   "
-                    # remove 7 reserved bits from last word
-                    hlth >>= 7
-                    for i in range(1, 20):
-                        # take 9 bits at a time from the top
-                        h = (hlth >> ((19 - i) * 9)) & 0x1ff
-                        s += " %3x" % h
-                elif 8 == Pnum:
-                    # remove 63 reserved bits from LSBs
-                    hlth >>= 63
-                    WNa = (hlth >> 8) & 0x0ff
-                    t0a = hlth & 0x0ff
-                    # Hea20 to Hea30 now in the LSB
-                    hlth >>= 16
-                    s += "Health 20 to 30 WNa %u t0a %u\n       " % (WNa, t0a)
-                    for i in range(20, 31):
-                        # take 9 bits at a time from the top
-                        h = (hlth >> ((30 - i) * 9)) & 0x1ff
-                        s += " %3x" % h
-                elif 9 == Pnum:
-                    A0GPS = (page >> 106) & 0x03fff
-                    A1GPS = ((page >> 188) & 0x03) << 14
-                    A1GPS |= (page >> 166) & 0x03fff
-                    A0GAL = ((page >> 158) & 0x0ff) << 6
-                    A0GAL |= (page >> 144) & 0x03f
-                    A1GAL = (page >> 128) & 0x0ffff
-                    A0GLO = (page >> 106) & 0x03fff
-                    A1GLO = ((page >> 98) & 0x0f) << 8
-                    A1GLO |= (page >> 82) & 0x0f
-                    s += ("Timing A0GPS %u A1GPS %u A0GAL %u A1GAL %u"
-                          "\n       A0GLO %u A1GLO %u" %
-                          (A0GPS, A1GPS, A0GAL, A1GAL, A0GLO, A1GLO))
-                elif 10 == Pnum:
-                    deltatLS = ((page >> 248) & 0x03) << 6
-                    deltatLS |= (page >> 234) & 0x03f
-                    deltatLSF = (page >> 226) & 0x0ff
-                    WNLSF = (page >> 218) & 0x0ff
-                    A0UTC = ((page >> 188) & 0x03fffff) << 10
-                    A0UTC |= (page >> 170) & 0x03ff
-                    A1UTC = ((page >> 158) & 0x0fff) << 12
-                    A1UTC |= (page >> 138) & 0x0fff
-                    DN = (page >> 130) & 0x0ff
-                    s += ("Timing: deltatLS %u deltatLSF %u WNLSF %u A0UTC %u"
-                          " A1UTC %u" %
-                          (deltatLS, deltatLSF, WNLSF, A0UTC, A1UTC))
-                elif 24 == Pnum:
-                    # ICD calls this AmID and AmEpID
-                    AmEpID = (page >> 83) & 3
-                    if 3 != AmEpID:
-                        # not Almanac
-                        s += "Reserved AmEpID %u" % AmEpID
-                    else:
-                        s += "Health 31 to 43: AmEpID %u" % AmEpID
-                        # Hea31 to Hea43 now in the LSB
-                        hlth >>= 85
-                        s += "Health 31 to 43 t0a %u\n       " % SOW
-                        for i in range(31, 44):
-                            # take 9 bits at a time from the top
-                            h = (hlth >> ((43 - i) * 9)) & 0x1ff
-                            s += " %3x" % h
-                else:
-                    s += "Unknown page number"
-            else:
-                s += "Unknown page number"
-
-        return s
+        dec = self.sfrbx_bds_fraid.get(FraID)
+        if dec is not None:
+            s += dec(self, FraID, SOW, page, words)
+
+        return s
+
+    def _decode_sfrbx_gal0(self, page):
+        """Decode Galileo I/NAV word type 0"""
+
+        s = "\n    Spare Word"
+        time = (page >> 120) & 3
+        if 2 == time:
+            # valid time
+            WN = (page >> 20) & 0x0fff
+            TOW = page & 0x0fffff
+            s += " WN %u TOW %u" % (WN, TOW)
+        return s
+
+    def _decode_sfrbx_gal1(self, page):
+        """Decode Galileo I/NAV word type 1"""
+
+        IODnav = (page >> 112) & 0x03ff
+        toe = (page >> 98) & 0x03fff
+        M0 = (page >> 66) & 0x0ffffffff
+        e = (page >> 34) & 0x0ffffffff
+        sqrt_A = (page >> 2) & 0x0ffffffff
+        return ("\n    Ephemeris 1: IODnav %u toe %u M0 %u e %u  sqrt_A %u" %
+                (IODnav, toe, M0, e, sqrt_A))
+
+    def _decode_sfrbx_gal2(self, page):
+        """Decode Galileo I/NAV word type 2"""
+
+        IODnav = (page >> 112) & 0x03ff
+        Omega0 = (page >> 80) & 0x0ffffffff
+        i0 = (page >> 48) & 0x0ffffffff
+        omega = (page >> 16) & 0x0ffffffff
+        i_dot = (page >> 2) & 0x03fff
+        return ("\n    Ephemeris 2: IODnav %u Omega0 %u i0 %u"
+                "\n       omega %u i_dot %u" %
+                (IODnav, Omega0, i0, omega, i_dot))
+
+    def _decode_sfrbx_gal3(self, page):
+        """Decode Galileo I/NAV word type 3"""
+
+        IODnav = (page >> 112) & 0x03ff
+        Omega_dot = (page >> 88) & 0x0ffffff
+        delta_n = (page >> 72) & 0x0ffff
+        Cuc = (page >> 56) & 0x0ffff
+        Cus = (page >> 40) & 0x0ffff
+        Crc = (page >> 24) & 0x0ffff
+        Crs = (page >> 8) & 0x0ffff
+        SISA = page & 0x0ff
+        return ("\n    Ephemeris 3: IODnav %u Omega_dot %u delta_n %u"
+                "\n       Cuc %u Cus %u Crs %u Crs %u SISA %u" %
+                (IODnav, Omega_dot, delta_n, Cuc, Cus, Crc, Crc, SISA))
+
+    def _decode_sfrbx_gal4(self, page):
+        """Decode Galileo I/NAV word type 4"""
+
+        IODnav = (page >> 112) & 0x03ff
+        SVID = (page >> 106) & 0x03f
+        Cic = (page >> 90) & 0x0ffff
+        Cis = (page >> 74) & 0x0ffff
+        t0c = (page >> 60) & 0x03fff
+        af0 = (page >> 29) & 0x07fffffff
+        af1 = (page >> 8) & 0x01fffff
+        af2 = (page >> 2) & 0x03f
+        return ("\n    Ephemeris 4: IODnav %u SVID %u Cic %u Cis %u"
+                "\n       t0c %u af0 %u af1 %u af2 %u" %
+                (IODnav, SVID, Cic, Cis, t0c, af0, af1, af2))
+
+    def _decode_sfrbx_gal5(self, page):
+        """Decode Galileo I/NAV word type 5"""
+
+        Ax_af0 = (page >> 111) & 0x7ff
+        Ax_af1 = (page >> 100) & 0x7ff
+        Ax_af2 = (page >> 86) & 0x3fff
+        Iono1 = (page >> 85) & 1
+        Iono2 = (page >> 84) & 1
+        Iono3 = (page >> 83) & 1
+        Iono4 = (page >> 82) & 1
+        Iono5 = (page >> 81) & 1
+        BGD_E1E5a = (page >> 71) & 0x3ff
+        BGD_E1E5b = (page >> 61) & 0x3ff
+        E5BHS = (page >> 59) & 3
+        E1BHS = (page >> 57) & 3
+        E5BDVS = (page >> 56) & 1
+        E1BDVS = (page >> 55) & 1
+        WN = (page >> 43) & 0x0fff
+        TOW = (page >> 23) & 0x0fffff
+        return ("\n    Ionosphere: Ax_af0 %u Ax_af1 %u Ax_af2 %u"
+                "\n       Iono1 %u Iono2 %u Iono3 %u Iono4 %u Iono5 %u"
+                "\n       BGD_E1E5a %u BGD_E1E5b %u E5BHS %u E1BHS %u"
+                "\n       E5BDVS %u E1BDVS %u WN %u TOW %u" %
+                (Ax_af0, Ax_af1, Ax_af2, Iono1, Iono2, Iono3, Iono4, Iono5,
+                 BGD_E1E5a, BGD_E1E5b, E5BHS, E1BHS, E5BDVS, E1BDVS,
+                 WN, TOW))
+
+    def _decode_sfrbx_gal6(self, page):
+        """Decode Galileo I/NAV word type 6"""
+
+        A0 = (page >> 90) & 0x0ffffffff
+        A1 = (page >> 66) & 0x0ffffff
+        delta_tLS = (page >> 58) & 0x0ff
+        t0t = (page >> 50) & 0x0ff
+        WN0t = (page >> 42) & 0x0ff
+        WNLSF = (page >> 34) & 0x0ff
+        DN = (page >> 31) & 7
+        delta_tLSF = (page >> 23) & 0x0ff
+        TOW = (page >> 3) & 0x0fffff
+        return ("\n    GST-UTC: A0 %u A1 %u delta_tLS %u t0t %u WN0t %u"
+                "\n       WNLSF %u DN %u delta_tLSF %u TOW %u" %
+                (A0, A1, delta_tLS, t0t, WN0t, WNLSF, DN, delta_tLSF, TOW))
+
+    def _decode_sfrbx_gal7(self, page):
+        """Decode Galileo I/NAV word type 7"""
+
+        IODa = (page >> 118) & 0x0f
+        WNa = (page >> 116) & 0x03
+        t0a = (page >> 106) & 0x03ff
+        SVID1 = (page >> 100) & 0x03f
+        delta_sqrtA = (page >> 87) & 0x01fff
+        e = (page >> 76) & 0x07ff
+        omega = (page >> 60) & 0x0ffff
+        delta_i = (page >> 49) & 0x07ff
+        Omage0 = (page >> 33) & 0x0ffff
+        Omage_dot = (page >> 22) & 0x07ff
+        M0 = (page >> 6) & 0x0ffff
+        return ("\n    Almanac SVID1 (1/2): IODa %u WNa %u t0a %u SVID1 %u"
+                "\n       delta_sqrtA %u e %u omega %u delta_i %u Omage0 %u"
+                "\n       Omage_dot %u M0 %u" %
+                (IODa, WNa, t0a, SVID1, delta_sqrtA, e, omega, delta_i,
+                 Omage0, Omage_dot, M0))
+
+    def _decode_sfrbx_gal8(self, page):
+        """Decode Galileo I/NAV word type 8"""
+
+        IODa = (page >> 118) & 0x0f
+        af0 = (page >> 102) & 0x0ffff
+        af1 = (page >> 89) & 0x01fff
+        E5BHS = (page >> 87) & 3
+        E1BHS = (page >> 85) & 3
+        SVID2 = (page >> 79) & 0x03f
+        delta_sqrtA = (page >> 66) & 0x01fff
+        e = (page >> 55) & 0x07ff
+        omega = (page >> 39) & 0x0ffff
+        delta_i = (page >> 28) & 0x07ff
+        Omage0 = (page >> 12) & 0x0ffff
+        Omage_dot = (page >> 1) & 0x07ff
+        return ("\n    Almanac SVID1 (2/2): IODa %u af0 %u af1 %u E5BHS %u "
+                "E1BHS %u"
+                "\n       SVID2 %u delta_sqrtA %u e %u omega %u delta_i %u"
+                "\n       Omage0 %u Omage_dot %u" %
+                (IODa, af0, af1, E5BHS, E1BHS, SVID2, delta_sqrtA, e, omega,
+                 delta_i, Omage0, Omage_dot))
+
+    def _decode_sfrbx_gal9(self, page):
+        """Decode Galileo I/NAV word type 9"""
+
+        IODa = (page >> 118) & 0x0f
+        WNa = (page >> 116) & 3
+        t0a = (page >> 106) & 0x03ff
+        M0 = (page >> 90) & 0x0ffff
+        af0 = (page >> 74) & 0x0ffff
+        af1 = (page >> 61) & 0x01fff
+        E5BHS = (page >> 59) & 3
+        E1BHS = (page >> 57) & 3
+        SVID3 = (page >> 51) & 0x03f
+        delta_sqrtA = (page >> 38) & 0x01fff
+        e = (page >> 27) & 0x07ff
+        omega = (page >> 11) & 0x0ffff
+        delta_i = page & 0x07ff
+        return ("\n    Almanac SVID2 (2/2): IODa %u WNa %u t0a %u M0 %u"
+                "\n       af0 %u af1 %u E5BHS %u E1BHS %u"
+                "\n       SVID3 %u delta_sqrtA %u e %u omega %u delta_i %u" %
+                (IODa, WNa, t0a, M0, af0, af1, E5BHS, E1BHS, SVID3,
+                 delta_sqrtA, e, omega, delta_i))
+
+    def _decode_sfrbx_gal10(self, page):
+        """Decode Galileo I/NAV word type 10"""
+
+        IODa = (page >> 118) & 0x0f
+        Omage0 = (page >> 102) & 0x0ffff
+        Omage_dot = (page >> 91) & 0x07ff
+        M0 = (page >> 75) & 0x0ffff
+        af0 = (page >> 59) & 0x0ffff
+        af1 = (page >> 46) & 0x01fff
+        E5BHS = (page >> 44) & 3
+        E1BHS = (page >> 42) & 3
+        A0G = (page >> 26) & 0x0ffff
+        A1G = (page >> 14) & 0x0fff
+        t0G = (page >> 6) & 0x0ff
+        WN0G = page & 0x3f
+        return ("\n    Almanac SVID3 (2/2): IODa %u Omage0 %u Omage_dot %u"
+                "\n       M0 %u af0 %u af1 %u E5BHS %u E1BHS %u"
+                "\n       A0G %u A1G %u t0G %u WN0G %u" %
+                (IODa, Omage0, Omage_dot, M0, af0, af1, E5BHS, E1BHS,
+                 A0G, A1G, t0G, WN0G))
+
+    def _decode_sfrbx_gal16(self, page):
+        """Decode Galileo I/NAV word type 16"""
+
+        deltaAred = (page >> 117) & 0x01f
+        exred = (page >> 104) & 0x01fff
+        eyred = (page >> 91) & 0x01fff
+        deltai0red = (page >> 74) & 0x01ffff
+        Omega0red = (page >> 51) & 0x07fffff
+        lambda0red = (page >> 28) & 0x07fffff
+        af0red = (page >> 6) & 0x03fffff
+        af1red = page & 0x03f
+        return ("\n    Reduced Clock and Ephemeris Data: deltaAred %u"
+                "\n       exred %u eyred %u deltai0red %u Omega0red %u"
+                "\n       lambda0red %u af0red %u af1red %u" %
+                (deltaAred, exred, eyred, deltai0red, Omega0red,
+                 lambda0red, af0red, af1red))
+
+    def _decode_sfrbx_gal_fec2(self, page):
+        """Decode Galileo I/NAV word types 17 to 20"""
+
+        return "\n    FEC2 Reed-Solomon for Clock and Ephemeris Data"
+
+    def _decode_sfrbx_gal63(self, page):
+        """Decode Galileo I/NAV word type 63"""
+
+        return "\n    Dummy Page"
+
+    # Galileo I/NAV word decoders, by word_type, all unscaled
+    sfrbx_gal_word_type = {
+        0: _decode_sfrbx_gal0,
+        1: _decode_sfrbx_gal1,
+        2: _decode_sfrbx_gal2,
+        3: _decode_sfrbx_gal3,
+        4: _decode_sfrbx_gal4,
+        5: _decode_sfrbx_gal5,
+        6: _decode_sfrbx_gal6,
+        7: _decode_sfrbx_gal7,
+        8: _decode_sfrbx_gal8,
+        9: _decode_sfrbx_gal9,
+        10: _decode_sfrbx_gal10,
+        16: _decode_sfrbx_gal16,
+        17: _decode_sfrbx_gal_fec2,
+        18: _decode_sfrbx_gal_fec2,
+        19: _decode_sfrbx_gal_fec2,
+        20: _decode_sfrbx_gal_fec2,
+        63: _decode_sfrbx_gal63,
+        }
 
     def _decode_sfrbx_gal(self, words):
         """Decode UBX-RXM-SFRBX Galileo I/NAV frames"""
@@ -6439,187 +6800,132 @@ protVer 34 and up
             s += "\n    Math Error!"
             return s
 
-        # all unscaled
-        if (0 == word_type):
-            s += "\n    Spare Word"
-            time = (page >> 120) & 3
-            if 2 == time:
-                # valid time
-                WN = (page >> 20) & 0x0fff
-                TOW = page & 0x0fffff
-                s += " WN %u TOW %u" % (WN, TOW)
-
-        elif (1 == word_type):
-            IODnav = (page >> 112) & 0x03ff
-            toe = (page >> 98) & 0x03fff
-            M0 = (page >> 66) & 0x0ffffffff
-            e = (page >> 34) & 0x0ffffffff
-            sqrt_A = (page >> 2) & 0x0ffffffff
-            s += ("\n    Ephemeris 1: IODnav %u toe %u M0 %u e %u  sqrt_A %u" %
-                  (IODnav, toe, M0, e, sqrt_A))
-        elif (2 == word_type):
-            IODnav = (page >> 112) & 0x03ff
-            Omega0 = (page >> 80) & 0x0ffffffff
-            i0 = (page >> 48) & 0x0ffffffff
-            omega = (page >> 16) & 0x0ffffffff
-            i_dot = (page >> 2) & 0x03fff
-            s += ("\n    Ephemeris 2: IODnav %u Omega0 %u i0 %u"
-                  "\n       omega %u i_dot %u" %
-                  (IODnav, Omega0, i0, omega, i_dot))
-        elif (3 == word_type):
-            IODnav = (page >> 112) & 0x03ff
-            Omega_dot = (page >> 88) & 0x0ffffff
-            delta_n = (page >> 72) & 0x0ffff
-            Cuc = (page >> 56) & 0x0ffff
-            Cus = (page >> 40) & 0x0ffff
-            Crc = (page >> 24) & 0x0ffff
-            Crs = (page >> 8) & 0x0ffff
-            SISA = page & 0x0ff
-            s += ("\n    Ephemeris 3: IODnav %u Omega_dot %u delta_n %u"
-                  "\n       Cuc %u Cus %u Crs %u Crs %u SISA %u" %
-                  (IODnav, Omega_dot, delta_n, Cuc, Cus, Crc, Crc, SISA))
-        elif (4 == word_type):
-            IODnav = (page >> 112) & 0x03ff
-            SVID = (page >> 106) & 0x03f
-            Cic = (page >> 90) & 0x0ffff
-            Cis = (page >> 74) & 0x0ffff
-            t0c = (page >> 60) & 0x03fff
-            af0 = (page >> 29) & 0x07fffffff
-            af1 = (page >> 8) & 0x01fffff
-            af2 = (page >> 2) & 0x03f
-            s += ("\n    Ephemeris 4: IODnav %u SVID %u Cic %u Cis %u"
-                  "\n       t0c %u af0 %u af1 %u af2 %u" %
-                  (IODnav, SVID, Cic, Cis, t0c, af0, af1, af2))
-        elif (5 == word_type):
-            Ax_af0 = (page >> 111) & 0x7ff
-            Ax_af1 = (page >> 100) & 0x7ff
-            Ax_af2 = (page >> 86) & 0x3fff
-            Iono1 = (page >> 85) & 1
-            Iono2 = (page >> 84) & 1
-            Iono3 = (page >> 83) & 1
-            Iono4 = (page >> 82) & 1
-            Iono5 = (page >> 81) & 1
-            BGD_E1E5a = (page >> 71) & 0x3ff
-            BGD_E1E5b = (page >> 61) & 0x3ff
-            E5BHS = (page >> 59) & 3
-            E1BHS = (page >> 57) & 3
-            E5BDVS = (page >> 56) & 1
-            E1BDVS = (page >> 55) & 1
-            WN = (page >> 43) & 0x0fff
-            TOW = (page >> 23) & 0x0fffff
-            s += ("\n    Ionosphere: Ax_af0 %u Ax_af1 %u Ax_af2 %u"
-                  "\n       Iono1 %u Iono2 %u Iono3 %u Iono4 %u Iono5 %u"
-                  "\n       BGD_E1E5a %u BGD_E1E5b %u E5BHS %u E1BHS %u"
-                  "\n       E5BDVS %u E1BDVS %u WN %u TOW %u" %
-                  (Ax_af0, Ax_af1, Ax_af2, Iono1, Iono2, Iono3, Iono4, Iono5,
-                   BGD_E1E5a, BGD_E1E5b, E5BHS, E1BHS, E5BDVS, E1BDVS,
-                   WN, TOW))
-        elif (6 == word_type):
-            A0 = (page >> 90) & 0x0ffffffff
-            A1 = (page >> 66) & 0x0ffffff
-            delta_tLS = (page >> 58) & 0x0ff
-            t0t = (page >> 50) & 0x0ff
-            WN0t = (page >> 42) & 0x0ff
-            WNLSF = (page >> 34) & 0x0ff
-            DN = (page >> 31) & 7
-            delta_tLSF = (page >> 23) & 0x0ff
-            TOW = (page >> 3) & 0x0fffff
-            s += ("\n    GST-UTC: A0 %u A1 %u delta_tLS %u t0t %u WN0t %u"
-                  "\n       WNLSF %u DN %u delta_tLSF %u TOW %u" %
-                  (A0, A1, delta_tLS, t0t, WN0t, WNLSF, DN, delta_tLSF, TOW))
-        elif (7 == word_type):
-            IODa = (page >> 118) & 0x0f
-            WNa = (page >> 116) & 0x03
-            t0a = (page >> 106) & 0x03ff
-            SVID1 = (page >> 100) & 0x03f
-            delta_sqrtA = (page >> 87) & 0x01fff
-            e = (page >> 76) & 0x07ff
-            omega = (page >> 60) & 0x0ffff
-            delta_i = (page >> 49) & 0x07ff
-            Omage0 = (page >> 33) & 0x0ffff
-            Omage_dot = (page >> 22) & 0x07ff
-            M0 = (page >> 6) & 0x0ffff
-            s += ("\n    Almanac SVID1 (1/2): IODa %u WNa %u t0a %u SVID1 %u"
-                  "\n       delta_sqrtA %u e %u omega %u delta_i %u Omage0 %u"
-                  "\n       Omage_dot %u M0 %u" %
-                  (IODa, WNa, t0a, SVID1, delta_sqrtA, e, omega, delta_i,
-                   Omage0, Omage_dot, M0))
-        elif (8 == word_type):
-            IODa = (page >> 118) & 0x0f
-            af0 = (page >> 102) & 0x0ffff
-            af1 = (page >> 89) & 0x01fff
-            E5BHS = (page >> 87) & 3
-            E1BHS = (page >> 85) & 3
-            SVID2 = (page >> 79) & 0x03f
-            delta_sqrtA = (page >> 66) & 0x01fff
-            e = (page >> 55) & 0x07ff
-            omega = (page >> 39) & 0x0ffff
-            delta_i = (page >> 28) & 0x07ff
-            Omage0 = (page >> 12) & 0x0ffff
-            Omage_dot = (page >> 1) & 0x07ff
-            s += ("\n    Almanac SVID1 (2/2): IODa %u af0 %u af1 %u E5BHS %u "
-                  "E1BHS %u"
-                  "\n       SVID2 %u delta_sqrtA %u e %u omega %u delta_i %u"
-                  "\n       Omage0 %u Omage_dot %u" %
-                  (IODa, af0, af1, E5BHS, E1BHS, SVID2, delta_sqrtA, e, omega,
-                   delta_i, Omage0, Omage_dot))
-        elif (9 == word_type):
-            IODa = (page >> 118) & 0x0f
-            WNa = (page >> 116) & 3
-            t0a = (page >> 106) & 0x03ff
-            M0 = (page >> 90) & 0x0ffff
-            af0 = (page >> 74) & 0x0ffff
-            af1 = (page >> 61) & 0x01fff
-            E5BHS = (page >> 59) & 3
-            E1BHS = (page >> 57) & 3
-            SVID3 = (page >> 51) & 0x03f
-            delta_sqrtA = (page >> 38) & 0x01fff
-            e = (page >> 27) & 0x07ff
-            omega = (page >> 11) & 0x0ffff
-            delta_i = page & 0x07ff
-            s += ("\n    Almanac SVID2 (2/2): IODa %u WNa %u t0a %u M0 %u"
-                  "\n       af0 %u af1 %u E5BHS %u E1BHS %u"
-                  "\n       SVID3 %u delta_sqrtA %u e %u omega %u delta_i %u" %
-                  (IODa, WNa, t0a, M0, af0, af1, E5BHS, E1BHS, SVID3,
-                   delta_sqrtA, e, omega, delta_i))
-        elif (10 == word_type):
-            IODa = (page >> 118) & 0x0f
-            Omage0 = (page >> 102) & 0x0ffff
-            Omage_dot = (page >> 91) & 0x07ff
-            M0 = (page >> 75) & 0x0ffff
-            af0 = (page >> 59) & 0x0ffff
-            af1 = (page >> 46) & 0x01fff
-            E5BHS = (page >> 44) & 3
-            E1BHS = (page >> 42) & 3
-            A0G = (page >> 26) & 0x0ffff
-            A1G = (page >> 14) & 0x0fff
-            t0G = (page >> 6) & 0x0ff
-            WN0G = page & 0x3f
-            s += ("\n    Almanac SVID3 (2/2): IODa %u Omage0 %u Omage_dot %u"
-                  "\n       M0 %u af0 %u af1 %u E5BHS %u E1BHS %u"
-                  "\n       A0G %u A1G %u t0G %u WN0G %u" %
-                  (IODa, Omage0, Omage_dot, M0, af0, af1, E5BHS, E1BHS,
-                   A0G, A1G, t0G, WN0G))
-        elif (16 == word_type):
-            deltaAred = (page >> 117) & 0x01f
-            exred = (page >> 104) & 0x01fff
-            eyred = (page >> 91) & 0x01fff
-            deltai0red = (page >> 74) & 0x01ffff
-            Omega0red = (page >> 51) & 0x07fffff
-            lambda0red = (page >> 28) & 0x07fffff
-            af0red = (page >> 6) & 0x03fffff
-            af1red = page & 0x03f
-            s += ("\n    Reduced Clock and Ephemeris Data: deltaAred %u"
-                  "\n       exred %u eyred %u deltai0red %u Omega0red %u"
-                  "\n       lambda0red %u af0red %u af1red %u" %
-                  (deltaAred, exred, eyred, deltai0red, Omega0red,
-                   lambda0red, af0red, af1red))
-        elif (17 <= word_type and 20 >= word_type):
-            s += "\n    FEC2 Reed-Solomon for Clock and Ephemeris Data"
-        elif (63 == word_type):
-            s += "\n    Dummy Page"
-
-        return s
+        dec = self.sfrbx_gal_word_type.get(word_type)
+        if dec is not None:
+            s += dec(self, page)
+
+        return s
+
+    def _decode_sfrbx_glo1(self, frame, page):
+        """Decode GLONASS string 1"""
+
+        P1 = (page >> 119) & 3
+        tk = (page >> 107) & 0x0fff
+        xnp = (page >> 83) & 0x0ffffff
+        xnpp = (page >> 78) & 0x01f
+        xn = (page >> 51) & 0x07ffffff
+        return ("\n        Ephemeris 1: P1 %u tk %u xnp %u xnpp %u xn %u" %
+                (P1, tk, xnp, xnpp, xn))
+
+    def _decode_sfrbx_glo2(self, frame, page):
+        """Decode GLONASS string 2"""
+
+        Bn = (page >> 120) & 7
+        P2 = (page >> 119) & 1
+        tb = (page >> 112) & 0x07f
+        ynp = (page >> 83) & 0x0ffffff
+        ynpp = (page >> 78) & 0x01f
+        yn = (page >> 51) & 0x07ffffff
+        return ("\n        Ephemeris 2: Bn %u P2 %u tb %u ynp %u ynpp %u "
+                "yn %u" %
+                (Bn, P2, tb, ynp, ynpp, yn))
+
+    def _decode_sfrbx_glo3(self, frame, page):
+        """Decode GLONASS string 3"""
+
+        P3 = (page >> 122) & 1
+        lambdan = (page >> 111) & 0x07fff
+        p = (page >> 108) & 3
+        ln = (page >> 107) & 1
+        znp = (page >> 83) & 0x0ffffff
+        znpp = (page >> 78) & 0x01f
+        zn = (page >> 51) & 0x07ffffff
+        return ("\n        Ephemeris 3: P3 %u znp %u znpp %u zn %u" %
+                (P3, znp, znpp, zn))
+
+    def _decode_sfrbx_glo4(self, frame, page):
+        """Decode GLONASS string 4"""
+
+        # n is SVID
+        taun = (page >> 101) & 0x03ffffff
+        deltataun = (page >> 96) & 0x01f
+        En = (page >> 91) & 0x01f
+        P4 = (page >> 76) & 1
+        FT = (page >> 72) & 0x0f
+        NT = (page >> 58) & 0x03fff
+        n = (page >> 53) & 0x1f
+        M = (page >> 51) & 3
+        return ("\n        Ephemeris 4: taun %u deltataun %u En %u P4 %u"
+                "\n           FT %u NT %u n %u M %u" %
+                (taun, deltataun, En, P4, FT, NT, n, M))
+
+    def _decode_sfrbx_glo5(self, frame, page):
+        """Decode GLONASS string 5"""
+
+        NA = (page >> 112) & 0x07ff
+        tauc = (page >> 80) & 0x0ffffffff
+        N4 = (page >> 74) & 0x01f
+        tauGPS = (page >> 52) & 0x03fffff
+        ln = (page >> 51) & 1
+        return ("\n        Time: NA %u tauc %u N4 %u tauGPS %u ln %u" %
+                (NA, tauc, N4, tauGPS, ln))
+
+    def _decode_sfrbx_glo_even(self, frame, page):
+        """Decode GLONASS strings 6, 8, 10, 12, 14"""
+
+        if 5 == frame:
+            B1 = (page >> 112) & 0x07ff
+            B2 = (page >> 102) & 0x03ff
+            KP = (page >> 100) & 3
+            return "\n        Extra 1: B1 %u B2 %u KP %u" % (B1, B2, KP)
+        else:
+            Cn = (page >> 122) & 1
+            m = (page >> 120) & 3
+            nA = (page >> 115) & 0x1f
+            tauA = (page >> 105) & 0x03ff
+            lambdaA = (page >> 84) & 0x01ffffff
+            deltaiA = (page >> 66) & 0x03ffff
+            epsilonA = (page >> 51) & 0x07fff
+            return ("\n        Almanac: Cn %u m %u nA %u tauA %u "
+                    "lambdaA %u deltaiA %u"
+                    "\n          epsilonA %u" %
+                    (Cn, m, nA, tauA, lambdaA, deltaiA, epsilonA))
+
+    def _decode_sfrbx_glo_odd(self, frame, page):
+        """Decode GLONASS strings 7, 9, 11, 13, 15"""
+
+        if 5 == frame:
+            ln = (page >> 51) & 1
+            return "\n        Extra 2: ln %u" % ln
+        else:
+            omegaA = (page >> 107) & 0x0ffff
+            tA = (page >> 86) & 0x01fffff
+            deltaTA = (page >> 64) & 0x03ffffff
+            deltaTpA = (page >> 57) & 0x07f
+            HA = (page >> 52) & 0x01f
+            ln = (page >> 51) & 1
+            return ("\n        Almanac: omegaA %u tA %u deltaTA %u "
+                    "deltaTpA %u HA %u ln %u" %
+                    (omegaA, tA, deltaTA, deltaTpA, HA, ln))
+
+    # GLONASS string decoders, by stringnum
+    sfrbx_glo_stringnum = {
+        1: _decode_sfrbx_glo1,
+        2: _decode_sfrbx_glo2,
+        3: _decode_sfrbx_glo3,
+        4: _decode_sfrbx_glo4,
+        5: _decode_sfrbx_glo5,
+        6: _decode_sfrbx_glo_even,
+        7: _decode_sfrbx_glo_odd,
+        8: _decode_sfrbx_glo_even,
+        9: _decode_sfrbx_glo_odd,
+        10: _decode_sfrbx_glo_even,
+        11: _decode_sfrbx_glo_odd,
+        12: _decode_sfrbx_glo_even,
+        13: _decode_sfrbx_glo_odd,
+        14: _decode_sfrbx_glo_even,
+        15: _decode_sfrbx_glo_odd,
+        }
 
     def _decode_sfrbx_glo(self, words):
         """Decode UBX-RXM-SFRBX GLONASS frames"""
@@ -6634,7 +6940,7 @@ protVer 34 and up
         page = 0
         for i in range(0, 4):
             page <<= 32
-            page |= words[i] & 0x0ffffffff
+            page |= words[i]
 
         # sanity check
         if (stringnum != ((page >> 123) & 0x0f)):
@@ -6648,89 +6954,44 @@ protVer 34 and up
 
         s = ("\n    GLO: superframe %u frame %u stringnum %u" %
              (superframe, frame, stringnum))
-        if 1 == stringnum:
-            P1 = (page >> 119) & 3
-            tk = (page >> 107) & 0x0fff
-            xnp = (page >> 83) & 0x0ffffffff
-            xnpp = (page >> 78) & 0x01f
-            xn = (page >> 51) & 0xa30ffffffff
-            s += ("\n        Ephemeris 1: P1 %u tk %u xnp %u xnpp %u xn %u" %
-                  (P1, tk, xnp, xnpp, xn))
-        if 2 == stringnum:
-            Bn = (page >> 120) & 7
-            P2 = (page >> 119) & 1
-            tb = (page >> 112) & 0x07f
-            ynp = (page >> 83) & 0x0ffffffff
-            ynpp = (page >> 78) & 0x01f
-            yn = (page >> 51) & 0xa30ffffffff
-            s += ("\n        Ephemeris 2: Bn %u P2 %u tb %u ynp %u ynpp %u "
-                  "yn %u" %
-                  (Bn, P2, tb, ynp, ynpp, yn))
-        if 3 == stringnum:
-            P3 = (page >> 122) & 1
-            lambdan = (page >> 111) & 0x07fff
-            p = (page >> 108) & 3
-            ln = (page >> 107) & 1
-            znp = (page >> 83) & 0x0ffffffff
-            znpp = (page >> 78) & 0x01f
-            zn = (page >> 51) & 0xa30ffffffff
-            s += ("\n        Ephemeris 3: P3 %u znp %u znpp %u zn %u" %
-                  (P3, znp, znpp, zn))
-        if 4 == stringnum:
-            # n is SVID
-            taun = (page >> 101) & 0x03ffffff
-            deltataun = (page >> 96) & 0x01f
-            En = (page >> 91) & 0x01f
-            P4 = (page >> 76) & 1
-            FT = (page >> 72) & 0x0f
-            NT = (page >> 58) & 0x03fff
-            n = (page >> 53) & 0x1f
-            M = (page >> 51) & 3
-            s += ("\n        Ephemeris 4: taun %u deltataun %u En %u P4 %u"
-                  "\n           FT %u NT %u n %u M %u" %
-                  (taun, deltataun, En, P4, FT, NT, n, M))
-        if 5 == stringnum:
-            NA = (page >> 112) & 0x07ff
-            tauc = (page >> 80) & 0x0ffffffff
-            N4 = (page >> 74) & 0x01f
-            tauGPS = (page >> 52) & 0x03fffff
-            ln = (page >> 51) & 1
-            s += ("\n        Time: NA %u tauc %u N4 %u tauGPS %u ln %u" %
-                  (NA, tauc, N4, tauGPS, ln))
-        if stringnum in [6, 8, 10, 12, 14]:
-            if 5 == frame:
-                B1 = (page >> 112) & 0x07ff
-                B2 = (page >> 102) & 0x03ff
-                KP = (page >> 100) & 3
-                s += "\n        Extra 1: B1 %u B2 %u KP %u" % (B1, B2, KP)
-            else:
-                Cn = (page >> 122) & 1
-                m = (page >> 120) & 3
-                nA = (page >> 115) & 0x1f
-                tauA = (page >> 105) & 0x03ff
-                lambdaA = (page >> 84) & 0x01ffffff
-                deltaiA = (page >> 66) & 0x03ffff
-                epsilonA = (page >> 51) & 0x07fff
-                s += ("\n        Almanac: Cn %u m %u nA %u tauA %u "
-                      "lambdaA %u deltaiA %u"
-                      "\n          epsilonA %u" %
-                      (Cn, m, nA, tauA, lambdaA, deltaiA, epsilonA))
-        if stringnum in [7, 9, 11, 13, 15]:
-            if 5 == frame:
-                ln = (page >> 51) & 1
-                s += "\n        Extra 2: ln %u" % ln
-            else:
-                omegaA = (page >> 107) & 0x0ffff
-                tA = (page >> 86) & 0x01fffff
-                deltaTA = (page >> 64) & 0x03ffffff
-                deltaTpA = (page >> 57) & 0x07f
-                HA = (page >> 52) & 0x01f
-                ln = (page >> 51) & 1
-                s += ("\n        Almanac: omegaA %u tA %u deltaTA %u "
-                      "deltaTpA %u HA %u ln %u" %
-                      (omegaA, tA, deltaTA, deltaTpA, HA, ln))
-
-        return s
+        dec = self.sfrbx_glo_stringnum.get(stringnum)
+        if dec is not None:
+            s += dec(self, frame, page)
+
+        return s
+
+    # SBAS message types, by msg_type
+    sfrbx_sbas_msg_type = {
+        0: "Don't use",
+        1: "PRN mask assignments",
+        2: "Fast Corrections 2",
+        3: "Fast Corrections 3",
+        4: "Fast Corrections 4",
+        5: "Fast Corrections 5",
+        6: "Integity information",
+        7: "Degradation Parameters",
+        9: "Geo Navigation message (X,Y,Z, time, etc.)",
+        10: "Degradation parameters",
+        12: "SBAS Network time/UTC offset parameters",
+        17: "Geo satellite almanacs",
+        18: "Ionospheric grid points masks",
+        24: "Mixed fast/long term satellite error corrections",
+        25: "Long term satellite error corrections",
+        26: "Ionospheric delay corrections",
+        27: "SBAS Service message",
+        28: "Clock Ephemeris Covariance Matrix message",
+        31: "L5 Satellite Mask",
+        32: "L5 Clock-Ephemeris Corrections/Covariance Matrix ",
+        34: "L5 Integrity message",
+        35: "L5 Integrity message",
+        36: "L5 Integrity message",
+        37: "L5 Degradation Parameters and DREI Scale Table",
+        39: "L5 SBAS Sats Ephemeris and Covariance Matrix",
+        40: "L5 SBAS Sats Ephemeris and Covariance Matrix",
+        47: "L5 SBAS broadcasting Satellite Almanac",
+        62: "Instant Test Message",
+        63: "Null Message",
+        }
 
     def _decode_sfrbx_sbas(self, words):
         """Decode UBX-RXM-SFRBX SBAS subframes"""
@@ -6749,7 +7010,7 @@ protVer 34 and up
 
         page = 0
         for i in range(0, 8):
-            page |= words[i] & 0x0ffffffff
+            page |= words[i]
             page <<= 32
         # trim parity and pad
         page >>= 30
@@ -6762,64 +7023,9 @@ protVer 34 and up
                   (msg_type, (page >> 212) & 0x3f, page))
             return s
 
-        if 0 == msg_type:
-            s += "\n       Don't use"
-        elif 1 == msg_type:
-            s += "\n       PRN mask assignments"
-        elif 2 == msg_type:
-            s += "\n       Fast Corrections 2"
-        elif 3 == msg_type:
-            s += "\n       Fast Corrections 3"
-        elif 4 == msg_type:
-            s += "\n       Fast Corrections 4"
-        elif 5 == msg_type:
-            s += "\n       Fast Corrections 5"
-        elif 6 == msg_type:
-            s += "\n       Integity information"
-        elif 7 == msg_type:
-            s += "\n       Degradation Parameters"
-        elif 9 == msg_type:
-            s += "\n       Geo Navigation message (X,Y,Z, time, etc.)"
-        elif 10 == msg_type:
-            s += "\n       Degradation parameters"
-        elif 12 == msg_type:
-            s += "\n       SBAS Network time/UTC offset parameters"
-        elif 17 == msg_type:
-            s += "\n       Geo satellite almanacs"
-        elif 18 == msg_type:
-            s += "\n       Ionospheric grid points masks"
-        elif 24 == msg_type:
-            s += "\n       Mixed fast/long term satellite error corrections"
-        elif 25 == msg_type:
-            s += "\n       Long term satellite error corrections"
-        elif 26 == msg_type:
-            s += "\n       Ionospheric delay corrections"
-        elif 27 == msg_type:
-            s += "\n       SBAS Service message"
-        elif 28 == msg_type:
-            s += "\n       Clock Ephemeris Covariance Matrix message"
-        elif 31 == msg_type:
-            s += "\n       L5 Satellite Mask"
-        elif 32 == msg_type:
-            s += "\n       L5 Clock-Ephemeris Corrections/Covariance Matrix "
-        elif 34 == msg_type:
-            s += "\n       L5 Integrity message"
-        elif 35 == msg_type:
-            s += "\n       L5 Integrity message"
-        elif 36 == msg_type:
-            s += "\n       L5 Integrity message"
-        elif 37 == msg_type:
-            s += "\n       L5 Degradation Parameters and DREI Scale Table"
-        elif 39 == msg_type:
-            s += "\n       L5 SBAS Sats Ephemeris and Covariance Matrix"
-        elif 40 == msg_type:
-            s += "\n       L5 SBAS Sats Ephemeris and Covariance Matrix"
-        elif 47 == msg_type:
-            s += "\n       L5 SBAS broadcasting Satellite Almanac"
-        elif 62 == msg_type:
-            s += "\n       Instant Test Message"
-        elif 63 == msg_type:
-            s += "\n       Null Message"
+        msg_name = self.sfrbx_sbas_msg_type.get(msg_type)
+        if msg_name is not None:
+            s += "\n       " + msg_name
 
         return s
 
@@ -6871,6 +7077,10 @@ protVer 34 and up
         63: 25,  # A-S Flags/ SV health
         }
 
+    # sbfr4_svid_page of every possible 6-bit svid, built once
+    sbfr4_svid_pages = tuple(map(sbfr4_svid_page.get, range(64),
+                                 ('Unk',) * 64))
+
     # map subframe 5 SV ID to Page number
     # IS-GPS-200K Table 20-V
     sbfr5_svid_page = {
@@ -6902,6 +7112,10 @@ protVer 34 and up
         51: 25,  # SV Health, SC 1 to 24
         }
 
+    # sbfr5_svid_page of every possible 6-bit svid, built once
+    sbfr5_svid_pages = tuple(map(sbfr5_svid_page.get, range(64),
+                                 ('Unk',) * 64))
+
     # URA Index to URA meters
     ura_meters = {
         0: "2.40 m",
@@ -6936,6 +7150,9 @@ protVer 34 and up
         3: "Reserved",
         }
 
+    # erd_s() of every possible 6-bit ERD, built once
+    nmct_erd_s = tuple(map(erd_s, range(64)))
+
     sv_conf = {
         0: "Reserved",
         1: "Block II/Block IIA/IIR SV",
@@ -6947,28 +7164,28 @@ protVer 34 and up
         7: "Reserved",
         }
 
+    rxm_sfrbx_struct = struct.Struct('<BBBBBBBB')
+
     def rxm_sfrbx(self, buf):
         """UBX-RXM-SFRBX decode, Broadcast Navigation Data Subframe"""
 
         # The way u-blox packs the subfram data is perverse, and
         # barely undocumnted.  Even more perverse than native subframes.
 
-        u = struct.unpack_from('<BBBBBBBB', buf, 0)
-        s = (' gnssId %u svId %3u reserved1 %u freqId %u numWords %u\n'
-             '  chn %u version %u reserved2 %u' % u)
-        words = ()
-        for i in range(0, u[4]):
-            u1 = struct.unpack_from('<L', buf, 8 + (i * 4))
-            words += (u1[0],)
+        verbose = gps.VERB_DECODE <= self.verbosity
 
-        if gps.VERB_DECODE <= self.verbosity:
-            s += '\n    dwrd'
-            i = 0
-            for word in words:
-                s += " %08x" % word
-                if 6 == (i % 7):
-                    s += "\n        "
-                i += 1
+        u = self.rxm_sfrbx_struct.unpack_from(buf, 0)
+        s = [' gnssId %u svId %3u reserved1 %u freqId %u numWords %u\n'
+             '  chn %u version %u reserved2 %u' % u]
+        words = struct.unpack_from('<%uL' % u[4], buf, 8)
+
+        if verbose:
+            dwrd = [" %08x" % word for word in words]
+            # seven words per line
+            for i in range(6, len(dwrd), 7):
+                dwrd[i] += "\n        "
+            s.append('\n    dwrd')
+            s.extend(dwrd)
 
         if ((0 == u[0] or
              5 == u[0])):
@@ -6977,9 +7194,9 @@ protVer 34 and up
             if 0x8b == preamble:
                 # CNAV
                 msgid = (words[0] >> 12) & 0x3f
-                s += ("\n  CNAV: preamble %#x PRN %u msgid %d (%s)\n" %
-                      (preamble, (words[0] >> 18) & 0x3f,
-                       msgid, index_s(msgid, self.cnav_msgids)))
+                s.append("\n  CNAV: preamble %#x PRN %u msgid %d (%s)\n" %
+                         (preamble, (words[0] >> 18) & 0x3f,
+                          msgid, self.cnav_msgids.get(msgid, "Unk")))
 
             else:
                 # IS-GPS-200, Figure 20-2
@@ -6988,15 +7205,15 @@ protVer 34 and up
                 #             plus something in top 2 bits?
                 preamble = words[0] >> 22
                 subframe = (words[1] >> 8) & 0x07
-                s += ("\n  LNAV-L: preamble %#x TLM %#x ISF %u" %
-                      (preamble, (words[0] >> 8) & 0xffff,
-                       1 if (words[0] & 0x40) else 0))
+                s.append("\n  LNAV-L: preamble %#x TLM %#x ISF %u" %
+                         (preamble, (words[0] >> 8) & 0xffff,
+                          1 if (words[0] & 0x40) else 0))
 
-                s += ("\n  TOW17 %u Alert %u A-S %u Subframe %u" %
-                      (unpack_u17(words[1], 13) * 6,
-                       1 if (words[0] & 0x1000) else 0,
-                       1 if (words[0] & 0x800) else 0,
-                       subframe))
+                s.append("\n  TOW17 %u Alert %u A-S %u Subframe %u" %
+                         (unpack_u17(words[1], 13) * 6,
+                          1 if (words[0] & 0x1000) else 0,
+                          1 if (words[0] & 0x800) else 0,
+                          subframe))
 
                 if 1 == subframe:
                     # not well validated decode, possibly wrong...
@@ -7011,21 +7228,21 @@ protVer 34 and up
                     c_on_l2 = (words[2] >> 18) & 0x03
                     iodc = ((((words[2] >> 6) & 0x03) << 8) |
                             (words[7] >> 24) & 0xff)
-                    s += ("\n   WN %u Codes on L2 %u (%s) URA %u (%s) "
-                          "SVH %#04x IODC %u" %
-                          (words[2] >> 20,
-                           c_on_l2, index_s(c_on_l2, self.codes_on_l2),
-                           ura, index_s(ura, self.ura_meters),
-                           (words[2] >> 8) & 0x3f, iodc))
+                    s.append("\n   WN %u Codes on L2 %u (%s) URA %u (%s) "
+                             "SVH %#04x IODC %u" %
+                             (words[2] >> 20,
+                              c_on_l2, self.codes_on_l2.get(c_on_l2, "Unk"),
+                              ura, self.ura_meters.get(ura, "Unk"),
+                              (words[2] >> 8) & 0x3f, iodc))
                     # tOC = Clock Data Reference Time of Week
-                    s += ("\n   L2 P DF %u TGD %e tOC %u\n"
-                          "   af2 %e af1 %e af0 %e" %
-                          ((words[2] >> 29) & 0x03,
-                           unpack_s8(words[6], 6) * (2 ** -31),
-                           unpack_u16(words[7], 6) * 16,
-                           unpack_s8(words[8], 22) * (2 ** -55),
-                           unpack_s16(words[8], 6) * (2 ** -43),
-                           unpack_s22(words[9], 8) * (2 ** -31)))
+                    s.append("\n   L2 P DF %u TGD %e tOC %u\n"
+                             "   af2 %e af1 %e af0 %e" %
+                             ((words[2] >> 29) & 0x03,
+                              unpack_s8(words[6], 6) * (2 ** -31),
+                              unpack_u16(words[7], 6) * 16,
+                              unpack_s8(words[8], 22) * (2 ** -55),
+                              unpack_s16(words[8], 6) * (2 ** -43),
+                              unpack_s22(words[9], 8) * (2 ** -31)))
 
                 elif 2 == subframe:
                     # not well validated decode, possibly wrong...
@@ -7042,19 +7259,19 @@ protVer 34 and up
                     #       to the Argument of Latitude
                     # sqrtA = Square Root of the Semi-Major Axis
                     # tOE = Reference Time Ephemeris
-                    s += ("\n   IODE %u Crs %e Deltan %e M0 %e"
-                          "\n   Cuc %e e %e Cus %e sqrtA %f"
-                          "\n   tOE %u" %
-                          (unpack_u8(words[2], 22),
-                           unpack_s16(words[2], 6) * (2 ** -5),
-                           unpack_s16(words[3], 14) * (2 ** -43),
-                           # M0
-                           unpack_s32s(words[4], words[3]) * (2 ** -31),
-                           unpack_s16(words[5], 14) * (2 ** -29),
-                           unpack_u32s(words[6], words[5]) * (2 ** -33),
-                           unpack_s16(words[7], 14) * (2 ** -29),
-                           unpack_u32s(words[8], words[7]) * (2 ** -19),
-                           unpack_u16(words[9], 14) * 16))
+                    s.append("\n   IODE %u Crs %e Deltan %e M0 %e"
+                             "\n   Cuc %e e %e Cus %e sqrtA %f"
+                             "\n   tOE %u" %
+                             (unpack_u8(words[2], 22),
+                              unpack_s16(words[2], 6) * (2 ** -5),
+                              unpack_s16(words[3], 14) * (2 ** -43),
+                              # M0
+                              unpack_s32s(words[4], words[3]) * (2 ** -31),
+                              unpack_s16(words[5], 14) * (2 ** -29),
+                              unpack_u32s(words[6], words[5]) * (2 ** -33),
+                              unpack_s16(words[7], 14) * (2 ** -29),
+                              unpack_u32s(words[8], words[7]) * (2 ** -19),
+                              unpack_u16(words[9], 14) * 16))
 
                 elif 3 == subframe:
                     # not well validated decode, possibly wrong...
@@ -7072,20 +7289,20 @@ protVer 34 and up
                     # Omegadot = Rate of Right Ascension
                     # IODE = Issue of Data (Ephemeris)
                     # IODT = Rate of Inclination Angle
-                    s += ("\n   Cic %e Omega0 %e Cis %e i0 %e"
-                          "\n   Crc %e omega %e Omegadot %e"
-                          "\n   IDOE %u IDOT %e" %
-                          (unpack_s16(words[2], 14) * (2 ** -29),
-                           unpack_s32s(words[3], words[2]) * (2 ** -31),
-                           unpack_s16(words[4], 14) * (2 ** -29),
-                           unpack_s32s(words[5], words[4]) * (2 ** -31),
-                           # Crc
-                           unpack_s16(words[6], 14) * (2 ** -5),
-                           unpack_s32s(words[7], words[6]) * (2 ** -31),
-                           # Omegadot
-                           unpack_s24(words[8], 6) * (2 ** -43),
-                           unpack_u8(words[9], 22),
-                           unpack_s14(words[9], 8) * (2 ** -43)))
+                    s.append("\n   Cic %e Omega0 %e Cis %e i0 %e"
+                             "\n   Crc %e omega %e Omegadot %e"
+                             "\n   IDOE %u IDOT %e" %
+                             (unpack_s16(words[2], 14) * (2 ** -29),
+                              unpack_s32s(words[3], words[2]) * (2 ** -31),
+                              unpack_s16(words[4], 14) * (2 ** -29),
+                              unpack_s32s(words[5], words[4]) * (2 ** -31),
+                              # Crc
+                              unpack_s16(words[6], 14) * (2 ** -5),
+                              unpack_s32s(words[7], words[6]) * (2 ** -31),
+                              # Omegadot
+                              unpack_s24(words[8], 6) * (2 ** -43),
+                              unpack_u8(words[9], 22),
+                              unpack_s14(words[9], 8) * (2 ** -43)))
 
                 elif 4 == subframe:
                     # pages:
@@ -7102,92 +7319,55 @@ protVer 34 and up
                     # 0 === svid is dummy SV
                     # almanac for dummy sat 0, same as transmitting sat
                     # Sec 3.2.1: "Users shall only use non-dummy satellites"
-                    page = index_s(svid, self.sbfr4_svid_page)
+                    page = self.sbfr4_svid_pages[svid]
 
-                    s += ("\n   dataid %u svid %u (page %s)\n" %
-                          (words[2] >> 28, svid, page))
+                    s.append("\n   dataid %u svid %u (page %s)\n" %
+                             (words[2] >> 28, svid, page))
                     if 'Unk' == page:
-                        s += "\n   Unknown page ????"
-                        return s
+                        s.append("\n   Unknown page ????")
+                        return ''.join(s)
 
                     if 6 == page:
-                        s += "    reserved"
+                        s.append("    reserved")
                     elif 2 <= page <= 10:
-                        s += self.almanac(words)
+                        s.append(self.almanac(words))
                     elif 13 == page:
                         # 20.3.3.5.1.9 NMCT.
                         # 30 ERDs, but more sats. A sat skips own ERD.
                         # no ERD for sat 32
                         # erds are signed! 0x20 == NA
-                        s += ("    NMCT AI %u(%s)"
-                              "\n      ERD1:  %s %s %s %s %s %s %s %s"
-                              "\n      ERD9:  %s %s %s %s %s %s %s %s"
-                              "\n      ERD17: %s %s %s %s %s %s %s %s"
-                              "\n      ERD25: %s %s %s %s %s %s" %
-                              ((words[2] >> 22) & 0x3,    # AI
-                               index_s((words[2] >> 22) & 0x3, self.nmct_ai),
-                               erd_s((words[2] >> 16) & 0x3f),   # erd1
-                               erd_s((words[2] >> 8) & 0x3f),
-                               erd_s((((words[2] >> 2) & 0x30) |
-                                      (words[3] >> 26) & 0x0f)),
-                               erd_s((words[3] >> 20) & 0x3f),
-                               erd_s((words[3] >> 14) & 0x3f),   # erd5
-                               erd_s((words[3] >> 8) & 0x3f),
-                               erd_s((((words[3] >> 2) & 0x30) |
-                                      (words[4] >> 26) & 0x0f)),
-                               erd_s((words[4] >> 20) & 0x3f),
-                               erd_s((words[4] >> 14) & 0x3f),   # erd9
-                               erd_s((words[4] >> 8) & 0x3f),
-                               erd_s((((words[4] >> 2) & 0x30) |
-                                      (words[5] >> 26) & 0x0f)),
-                               erd_s((words[5] >> 20) & 0x3f),
-                               erd_s((words[5] >> 14) & 0x3f),   # erd 13
-                               erd_s((words[5] >> 8) & 0x3f),
-                               erd_s((((words[5] >> 2) & 0x30) |
-                                      (words[6] >> 26) & 0x0f)),
-                               erd_s((words[6] >> 20) & 0x3f),
-                               erd_s((words[6] >> 14) & 0x3f),   # erd17
-                               erd_s((words[6] >> 8) & 0x3f),
-                               erd_s((((words[6] >> 2) & 0x30) |
-                                      (words[7] >> 26) & 0x0f)),
-                               erd_s((words[7] >> 20) & 0x3f),
-                               erd_s((words[7] >> 14) & 0x3f),   # erd21
-                               erd_s((words[7] >> 8) & 0x3f),
-                               erd_s((((words[7] >> 2) & 0x30) |
-                                      (words[8] >> 26) & 0x0f)),
-                               erd_s((words[8] >> 20) & 0x3f),
-                               erd_s((words[8] >> 14) & 0x3f),   # erd25
-                               erd_s((words[8] >> 8) & 0x3f),
-                               erd_s((((words[8] >> 2) & 0x30) |
-                                      (words[9] >> 26) & 0x0f)),
-                               erd_s((words[9] >> 20) & 0x3f),
-                               erd_s((words[9] >> 14) & 0x3f),   # erd29
-                               erd_s((words[9] >> 8) & 0x3f),    # erd30
-                               ))
+                        ai = (words[2] >> 22) & 0x3
+                        # ERD1 and ERD2 in word 2, then four per word,
+                        # the first of each four split across two words
+                        erds = [(words[2] >> 16) & 0x3f,
+                                (words[2] >> 8) & 0x3f]
+                        for i in range(2, 9):
+                            erds += [((words[i] >> 2) & 0x30) |
+                                     ((words[i + 1] >> 26) & 0x0f),
+                                     (words[i + 1] >> 20) & 0x3f,
+                                     (words[i + 1] >> 14) & 0x3f,
+                                     (words[i + 1] >> 8) & 0x3f]
+                        nmct_erd_s = self.nmct_erd_s
+                        s.append("    NMCT AI %u(%s)"
+                                 "\n      ERD1:  %s %s %s %s %s %s %s %s"
+                                 "\n      ERD9:  %s %s %s %s %s %s %s %s"
+                                 "\n      ERD17: %s %s %s %s %s %s %s %s"
+                                 "\n      ERD25: %s %s %s %s %s %s" %
+                                 ((ai, self.nmct_ai[ai]) +
+                                  tuple([nmct_erd_s[erd] for erd in erds])))
                     elif 17 == page:
-                        s += ("    Special messages: " +
-                              chr((words[2] >> 14) & 0xff) +
-                              chr((words[2] >> 6) & 0xff) +
-                              chr((words[3] >> 22) & 0xff) +
-                              chr((words[3] >> 14) & 0xff) +
-                              chr((words[3] >> 6) & 0xff) +
-                              chr((words[4] >> 22) & 0xff) +
-                              chr((words[4] >> 14) & 0xff) +
-                              chr((words[4] >> 6) & 0xff) +
-                              chr((words[5] >> 22) & 0xff) +
-                              chr((words[5] >> 14) & 0xff) +
-                              chr((words[5] >> 6) & 0xff) +
-                              chr((words[6] >> 22) & 0xff) +
-                              chr((words[6] >> 14) & 0xff) +
-                              chr((words[6] >> 6) & 0xff) +
-                              chr((words[7] >> 22) & 0xff) +
-                              chr((words[7] >> 14) & 0xff) +
-                              chr((words[7] >> 6) & 0xff) +
-                              chr((words[8] >> 22) & 0xff) +
-                              chr((words[8] >> 14) & 0xff) +
-                              chr((words[8] >> 6) & 0xff) +
-                              chr((words[9] >> 22) & 0xff) +
-                              chr((words[9] >> 14) & 0xff))
+                        # 22 8-bit characters, two in word 2, three per
+                        # word in words 3 to 8, two in word 9
+                        chars = [(words[2] >> 14) & 0xff,
+                                 (words[2] >> 6) & 0xff]
+                        for i in range(3, 9):
+                            chars += [(words[i] >> 22) & 0xff,
+                                      (words[i] >> 14) & 0xff,
+                                      (words[i] >> 6) & 0xff]
+                        chars += [(words[9] >> 22) & 0xff,
+                                  (words[9] >> 14) & 0xff]
+                        s.append("    Special messages: " +
+                                 ''.join(map(chr, chars)))
 
                     elif 18 == page:
                         alpha1 = (words[2] >> 14) & 0xff
@@ -7207,142 +7387,136 @@ protVer 34 and up
                         WNlsf = (words[8] >> 14) & 0xff
                         DN = (words[8] >> 6) & 0xff
                         deltatlsf = (words[9] >> 22) & 0xff
-                        s += ("    Ionospheric and UTC data\n"
-                              "     alpah0 x%02x alpah1 x%02x "
-                              "alpah2 x%02x alpah3 x%02x\n"
-                              "     beta0  x%02x beta1  x%02x "
-                              "beta2  x%02x beta3  x%02x\n"
-                              "     A0  x%08x A1  x%06x tot x%02x WNt x%02x\n"
-                              "     deltatls x%02x WNlsf x%02x DN x%02x "
-                              "deltatlsf x%02x" %
-                              (alpha0, alpha1, alpha2, alpha3,
-                               beta0, beta1, beta2, beta3,
-                               A0, A1, tot, WNt,
-                               deltatls, WNlsf, DN, deltatlsf))
+                        s.append("    Ionospheric and UTC data\n"
+                                 "     alpah0 x%02x alpah1 x%02x "
+                                 "alpah2 x%02x alpah3 x%02x\n"
+                                 "     beta0  x%02x beta1  x%02x "
+                                 "beta2  x%02x beta3  x%02x\n"
+                                 "     A0  x%08x A1  x%06x "
+                                 "tot x%02x WNt x%02x\n"
+                                 "     deltatls x%02x WNlsf x%02x DN x%02x "
+                                 "deltatlsf x%02x" %
+                                 (alpha0, alpha1, alpha2, alpha3,
+                                  beta0, beta1, beta2, beta3,
+                                  A0, A1, tot, WNt,
+                                  deltatls, WNlsf, DN, deltatlsf))
                     elif 25 == page:
-                        aspoof = []
-                        aspoof.append((words[2] >> 18) & 0x0f)
-                        aspoof.append((words[2] >> 14) & 0x0f)
-                        aspoof.append((words[2] >> 10) & 0x0f)
-                        aspoof.append((words[2] >> 6) & 0x0f)
-                        for i in range(3, 7):
-                            aspoof.append((words[i] >> 26) & 0x0f)
-                            aspoof.append((words[i] >> 22) & 0x0f)
-                            aspoof.append((words[i] >> 18) & 0x0f)
-                            aspoof.append((words[i] >> 14) & 0x0f)
-                            aspoof.append((words[i] >> 10) & 0x0f)
-                            aspoof.append((words[i] >> 6) & 0x0f)
-                        aspoof.append((words[7] >> 26) & 0x0f)
-                        aspoof.append((words[7] >> 22) & 0x0f)
-                        aspoof.append((words[7] >> 18) & 0x0f)
-                        aspoof.append((words[7] >> 14) & 0x0f)
-
-                        sv = []
-                        sv.append((words[7] >> 6) & 0x3f)
-                        sv.append((words[8] >> 24) & 0x3f)
-                        sv.append((words[8] >> 18) & 0x3f)
-                        sv.append((words[8] >> 12) & 0x3f)
-                        sv.append((words[8] >> 6) & 0x3f)
-                        sv.append((words[9] >> 24) & 0x3f)
-                        sv.append((words[9] >> 18) & 0x3f)
-                        sv.append((words[9] >> 12) & 0x3f)
-                        s += ("    A/S flags:\n"
-                              "     as01 x%x as02 x%x as03 x%x as04 x%x "
-                              "as05 x%x as06 x%x as07 x%x as08 x%x\n"
-                              "     as09 x%x as10 x%x as11 x%x as12 x%x "
-                              "as13 x%x as14 x%x as15 x%x as16 x%x\n"
-                              "     as17 x%x as18 x%x as19 x%x as20 x%x "
-                              "as21 x%x as22 x%x as23 x%x as24 x%x\n"
-                              "     as25 x%x as26 x%x as27 x%x as28 x%x "
-                              "as29 x%x as30 x%x as31 x%x as32 x%x\n" %
-                              tuple(aspoof))
-                        if gps.VERB_DECODE <= self.verbosity:
-                            for i in range(1, 33):
-                                f = aspoof[i - 1]
-                                s += ("      as%02d x%x (A-S %s, Conf %s)\n" %
-                                      (i, f,
-                                       'On' if (f & 8) else 'Off',
-                                       index_s(f & 7, self.sv_conf)))
-
-                        s += ("    SV HEALTH:\n"
-                              "      sv25 x%2x sv26 x%2x sv27 x%2x sv28 x%2x "
-                              "sv29 x%2x sv30 x%2x sv31 x%2x sv32 x%2x" %
-                              tuple(sv))
+                        # 4 bit A-S flags, 4 in word 2, 6 per word
+                        # in words 3 to 6, 4 in word 7
+                        aspoof = tuple([(words[2] >> n) & 0x0f
+                                        for n in (18, 14, 10, 6)] +
+                                       [(words[i] >> n) & 0x0f
+                                        for i in range(3, 7)
+                                        for n in (26, 22, 18, 14, 10, 6)] +
+                                       [(words[7] >> n) & 0x0f
+                                        for n in (26, 22, 18, 14)])
+
+                        # 6 bit health, SV 25 in word 7, then 4 and 3
+                        sv = ((words[7] >> 6) & 0x3f,
+                              (words[8] >> 24) & 0x3f,
+                              (words[8] >> 18) & 0x3f,
+                              (words[8] >> 12) & 0x3f,
+                              (words[8] >> 6) & 0x3f,
+                              (words[9] >> 24) & 0x3f,
+                              (words[9] >> 18) & 0x3f,
+                              (words[9] >> 12) & 0x3f)
+                        s.append("    A/S flags:\n"
+                                 "     as01 x%x as02 x%x as03 x%x as04 x%x "
+                                 "as05 x%x as06 x%x as07 x%x as08 x%x\n"
+                                 "     as09 x%x as10 x%x as11 x%x as12 x%x "
+                                 "as13 x%x as14 x%x as15 x%x as16 x%x\n"
+                                 "     as17 x%x as18 x%x as19 x%x as20 x%x "
+                                 "as21 x%x as22 x%x as23 x%x as24 x%x\n"
+                                 "     as25 x%x as26 x%x as27 x%x as28 x%x "
+                                 "as29 x%x as30 x%x as31 x%x as32 x%x\n" %
+                                 aspoof)
+                        if verbose:
+                            sv_conf = self.sv_conf
+                            onoff = ('Off', 'On')
+                            for i, f in enumerate(aspoof, 1):
+                                s.append("      as%02d x%x (A-S %s, "
+                                         "Conf %s)\n" %
+                                         (i, f, onoff[(f >> 3) & 1],
+                                          sv_conf.get(f & 7, "Unk")))
+
+                        s.append("    SV HEALTH:\n"
+                                 "      sv25 x%2x sv26 x%2x "
+                                 "sv27 x%2x sv28 x%2x "
+                                 "sv29 x%2x sv30 x%2x sv31 x%2x sv32 x%2x" %
+                                 sv)
                     else:
-                        s += "    Reserved"
+                        s.append("    Reserved")
 
                 elif 5 == subframe:
                     svid = (words[2] >> 22) & 0x3f
                     # 0 === svid is dummy SV
                     # almanac for dummy sat 0, same as transmitting sat
                     # Sec 3.2.1: "Users shall only use non-dummy satellites"
-                    page = index_s(svid, self.sbfr5_svid_page)
+                    page = self.sbfr5_svid_pages[svid]
 
-                    s += ("\n   dataid %u svid %u (page %s)\n" %
-                          (words[2] >> 28, svid, page))
+                    s.append("\n   dataid %u svid %u (page %s)\n" %
+                             (words[2] >> 28, svid, page))
                     if 'Unk' == page:
-                        s += "\n   Unknown page ????"
-                        return s
+                        s.append("\n   Unknown page ????")
+                        return ''.join(s)
 
                     if 1 <= page <= 24:
-                        s += self.almanac(words)
+                        s.append(self.almanac(words))
                     elif 25 == page:
                         toa = (words[2] >> 14) & 0xff
                         WNa = (words[2] >> 6) & 0xff
-                        sv = []
-                        for i in range(3, 9):
-                            sv.append((words[i] >> 24) & 0x3f)
-                            sv.append((words[i] >> 18) & 0x3f)
-                            sv.append((words[i] >> 12) & 0x3f)
-                            sv.append((words[i] >> 6) & 0x3f)
-                        s += "    SV HEALTH toa %u WNa %u\n" % (toa, WNa)
-                        s += ("     sv01 x%2x sv02 x%2x sv03 x%2x sv04 x%2x "
-                              "sv05 x%2x sv06 x%2x sv07 x%2x sv08 x%2x\n"
-                              "     sv09 x%2x sv10 x%2x sv11 x%2x sv12 x%2x "
-                              "sv13 x%2x sv14 x%2x sv15 x%2x sv16 x%2x\n"
-                              "     sv17 x%2x sv18 x%2x sv19 x%2x sv20 x%2x "
-                              "sv21 x%2x sv22 x%2x sv23 x%2x sv24 x%2x" %
-                              tuple(sv))
+                        sv = tuple([(words[i] >> n) & 0x3f
+                                    for i in range(3, 9)
+                                    for n in (24, 18, 12, 6)])
+                        s.append("    SV HEALTH toa %u WNa %u\n" % (toa, WNa))
+                        s.append("     sv01 x%2x sv02 x%2x "
+                                 "sv03 x%2x sv04 x%2x "
+                                 "sv05 x%2x sv06 x%2x sv07 x%2x sv08 x%2x\n"
+                                 "     sv09 x%2x sv10 x%2x "
+                                 "sv11 x%2x sv12 x%2x "
+                                 "sv13 x%2x sv14 x%2x sv15 x%2x sv16 x%2x\n"
+                                 "     sv17 x%2x sv18 x%2x "
+                                 "sv19 x%2x sv20 x%2x "
+                                 "sv21 x%2x sv22 x%2x sv23 x%2x sv24 x%2x" %
+                                 sv)
                     else:
-                        s += "    Reserved"
+                        s.append("    Reserved")
 
         elif 1 == u[0]:
             # SBAS
-            s += self._decode_sfrbx_sbas(words)
+            s.append(self._decode_sfrbx_sbas(words))
 
         elif 2 == u[0]:
             # Galileo
-            s += self._decode_sfrbx_gal(words)
+            s.append(self._decode_sfrbx_gal(words))
 
         elif 3 == u[0]:
             # BeiDou
-            s += self._decode_sfrbx_bds(words)
+            s.append(self._decode_sfrbx_bds(words))
 
         elif 6 == u[0]:
             # GLONASS
-            s += self._decode_sfrbx_glo(words)
+            s.append(self._decode_sfrbx_glo(words))
 
-        return s
+        return ''.join(s)
+
+    rxm_svsi_struct = struct.Struct('<LhBB')
+    rxm_svsi_sv_struct = struct.Struct('<BBhbB')
 
     def rxm_svsi(self, buf):
         """UBX-RXM-SVSI decode, SV Status Info"""
 
         # not in M10, protVer 34 and up
         # Use UBX-NAV-ORB instead
-        m_len = len(buf)
+        u = self.rxm_svsi_struct.unpack_from(buf, 0)
+        s = [' iTOW %d week %d numVis %d numSV %d' % u]
 
-        u = struct.unpack_from('<LhBB', buf, 0)
-        s = ' iTOW %d week %d numVis %d numSV %d' % u
+        unpack_sv = self.rxm_svsi_sv_struct.unpack_from
+        s.extend(['  svid %3d svFlag %#x azim %3d elev % 3d age %3d' %
+                  unpack_sv(buf, offset)
+                  for offset in range(8, len(buf), 6)])
 
-        m_len -= 8
-        i = 0
-        while 0 < m_len:
-            u = struct.unpack_from('<BBhbB', buf, 8 + i * 6)
-            s += '\n  svid %3d svFlag %#x azim %3d elev % 3d age %3d' % u
-            m_len -= 6
-            i += 1
-
-        return s
+        return '\n'.join(s)
 
     # Broadcom calls this BRM-ASC-
     rxm_ids = {0x10: {'str': 'RAW', 'dec': rxm_raw, 'minlen': 8,
@@ -7364,7 +7538,7 @@ protVer 34 and up
                0x32: {'str': 'RTCM', 'dec': rxm_rtcm, 'minlen': 8,
                       'name': 'UBX-RXM-RTCM'},
                # Broadcom calls this BRM-ASC-SCLEEP
-               0x41: {'str': 'PMREQ', 'dec': rxm_pmreq, 'minlen': 4,
+               0x41: {'str': 'PMREQ', 'dec': rxm_pmreq, 'minlen': 8,
                       'name': 'UBX-RXM-PMREQ'},
                0x59: {'str': 'RLM', 'dec': rxm_rlm, 'minlen': 16,
                       'name': 'UBX-RXM-RLM'},
@@ -7378,16 +7552,20 @@ protVer 34 and up
 
     # UBX-SEC-SESSID in protVer 34 and up
 
+    sec_sign_struct = struct.Struct('<BBHBBH')
+
     def sec_sign(self, buf):
         """UBX-SEC_SIGN decode, Signature of a previous message"""
 
         # protVer 18 to 23
-        u = struct.unpack_from('<BBHBBH', buf, 0)
+        u = self.sec_sign_struct.unpack_from(buf, 0)
         s = (" version %u reserved %u %u classId x%x messageID x%x "
              " checksum %u\n  hash " % u)
         s += gps.polystr(binascii.hexlify(buf[8:39]))
         return s
 
+    sec_uniqid_struct = struct.Struct('<BBHBBBBB')
+
     def sec_uniqid(self, buf):
         """UBX-SEC_UNIQID decode Unique chip ID
 
@@ -7397,13 +7575,12 @@ changed in protVer 34
         # protVer 18 is 9 bytes
         # 10 bytes in protVer 34 and up
         m_len = len(buf)
-        u = struct.unpack_from('<BBHBBBBB', buf, 0)
+        u = self.sec_uniqid_struct.unpack_from(buf, 0)
         s = ("  version %u reserved %u %u uniqueId %#02x%02x%02x%02x%02x"
              % u)
         if (9 < m_len):
             # version 2
-            u = struct.unpack_from('<B', buf, 9)
-            s += "%02x" % u
+            s += "%02x" % buf[9]
 
         return s
 
@@ -7414,29 +7591,41 @@ changed in protVer 34
                }
 
     # UBX-TIM-
+    tim_svin_struct = struct.Struct('<LlllLLBB')
+
     def tim_svin(self, buf):
         """UBX-TIM-SVIN decode, Survey-in data"""
 
-        u = struct.unpack_from('<LlllLLBB', buf, 0)
+        u = self.tim_svin_struct.unpack_from(buf, 0)
         s = ('  dur %u meanX %d meanY %d meanZ %d meanV %u\n'
              '  obs %u valid %u active %u' % u)
         return s
 
+    tim_tm2_struct = struct.Struct('<BBHHHLLLLL')
+
     def tim_tm2(self, buf):
         """UBX-TIM-TM2 decode, Time mark data"""
 
-        u = struct.unpack_from('<BBHHHLLLLL', buf, 0)
+        u = self.tim_tm2_struct.unpack_from(buf, 0)
         s = ('  ch %u flags %#x count %u wnR %u wnF %u\n'
              '  towMsR %u towSubMsR %u towMsF %u towSubMsF %u accEst %u\n' % u)
         return s
 
+    tim_tp_raim = {
+        0: "RAIM not available",
+        1: "RAIM not active",
+        2: "RAIM active",
+        }
+
+    tim_tp_struct = struct.Struct('<LLlHbb')
+
     def tim_tp(self, buf):
         """UBX-TIM-TP decode, Time Pulse Timedata
 
 qErrInvalid add in protVer 34 and up
 """
 
-        u = struct.unpack_from('<LLlHbb', buf, 0)
+        u = self.tim_tp_struct.unpack_from(buf, 0)
         s = ('  towMS %u towSubMS %u qErr %d week %d\n'
              '  flags %#x refInfo %#x\n   flags  ' % u)
 
@@ -7449,15 +7638,7 @@ qErrInvalid add in protVer 34 and up
         else:
             s += "UTC not available, "
 
-        raim = (u[4] >> 2) & 0x03
-        if 0 == raim:
-            s += "RAIM not available"
-        elif 1 == raim:
-            s += "RAIM not active"
-        elif 2 == raim:
-            s += "RAIM active"
-        else:
-            s += "RAIM ??"
+        s += self.tim_tp_raim.get((u[4] >> 2) & 0x03, "RAIM ??")
 
         # 9-series, protVer 32 and up.
         if 0x08 & u[4]:
@@ -7472,10 +7653,12 @@ qErrInvalid add in protVer 34 and up
         3: "source was AID-IN",
         }
 
+    tim_vrfy_struct = struct.Struct('<llllHBB')
+
     def tim_vrfy(self, buf):
         """UBX-TIM-VRFY decode, Sourced Time Verification"""
 
-        u = struct.unpack_from('<llllHBB', buf, 0)
+        u = self.tim_vrfy_struct.unpack_from(buf, 0)
         s = ('  itow %d frac %d deltaMs %d deltaMs %d\n'
              '  wno %u flags x%x reserved1 %u' % u)
         if gps.VERB_DECODE <= self.verbosity:
@@ -7525,6 +7708,8 @@ qErrInvalid add in protVer 34 and up
         3: "Not restored (no backup)",
         }
 
+    upd_sos_struct = struct.Struct('<BBH')
+
     def upd_sos(self, buf):
         """UBX-UPD-SOS decode, Backup File stuff"""
         m_len = len(buf)
@@ -7535,7 +7720,7 @@ qErrInvalid add in protVer 34 and up
         if 4 > m_len:
             return "  Bad Length %s" % m_len
 
-        u = struct.unpack_from('<BBH', buf, 0)
+        u = self.upd_sos_struct.unpack_from(buf, 0)
         s = '  command %u reserved1 x%x %x' % u
 
         s1 = ""
@@ -7549,12 +7734,12 @@ qErrInvalid add in protVer 34 and up
             s += "  Bad Length %s" % m_len
         elif 2 == u[0]:
             # Backup File Creation Acknowledge
-            u1 = struct.unpack_from('<BBH', buf, 4)
+            u1 = self.upd_sos_struct.unpack_from(buf, 4)
             s += '\n  response %u reserved2 x%x %x' % u1
             s1 = ' response (%s)' % index_s(u1[0], self.upd_sos_response2)
         elif 3 == u[0]:
             # System Restored from Backup
-            u1 = struct.unpack_from('<BBH', buf, 4)
+            u1 = self.upd_sos_struct.unpack_from(buf, 4)
             s += '\n  response %u reserved2 x%x %x' % u1
             s1 = ' response (%s)' % index_s(u1[0], self.upd_sos_response3)
 
@@ -7594,17 +7779,17 @@ qErrInvalid add in protVer 34 and up
     def class_id_s(self, m_class, m_id):
         """Return class and ID numbers as a string."""
 
+        # look up the class, and the ID, once
+        this_class = self.classes.get(m_class, {})
+        this_id = this_class.get('ids', {}).get(m_id, {})
+
         s = 'Class x%02x' % (m_class)
-        if (((m_class in self.classes and
-              'str' in self.classes[m_class]))):
-            s += ' (%s)' % (self.classes[m_class]['str'])
+        if 'str' in this_class:
+            s += ' (%s)' % (this_class['str'])
 
         s += ' ID x%02x' % (m_id)
-        if (((m_class in self.classes and
-              'ids' in self.classes[m_class] and
-              m_id in self.classes[m_class]['ids'] and
-              'str' in self.classes[m_class]['ids'][m_id]))):
-            s += ' (%s)' % (self.classes[m_class]['ids'][m_id]['str'])
+        if 'str' in this_id:
+            s += ' (%s)' % (this_id['str'])
 
         return s
 
@@ -7613,9 +7798,13 @@ qErrInvalid add in protVer 34 and up
 
         state = 'BASE'
         consumed = 0
+        # trace every byte?
+        raw_verbose = gps.VERB_RAW <= self.verbosity
 
         # decode state machine
-        for this_byte in out:
+        out_len = len(out)
+        while consumed < out_len:
+            this_byte = out[consumed]
             consumed += 1
             if isinstance(this_byte, str):
                 # a character, probably read from a file
@@ -7624,7 +7813,7 @@ qErrInvalid add in protVer 34 and up
                 # a byte, probably read from a serial port
                 c = int(this_byte)
 
-            if gps.VERB_RAW <= self.verbosity:
+            if raw_verbose:
                 if ord(' ') <= c <= ord('~'):
                     # c is printable
                     print("state: %s char %c (%#x)" % (state, chr(c), c))
@@ -7783,6 +7972,15 @@ qErrInvalid add in protVer 34 and up
                 if 0 == m_len:
                     # no payload
                     state = 'CSUM1'
+                elif not raw_verbose:
+                    # not tracing bytes, grab the whole payload at once
+                    m_payload = bytearray(out[consumed:consumed + m_len])
+                    if len(m_payload) < m_len:
+                        # partial message, wait for more
+                        return 0
+                    m_raw.extend(m_payload)
+                    consumed += m_len
+                    state = 'CSUM1'
                 else:
                     state = 'PAYLOAD'
                 continue
@@ -7816,35 +8014,47 @@ qErrInvalid add in protVer 34 and up
                           "was (%02x,%02x) s/b (%02x, %02x)\n" %
                           (m_ck_a, m_ck_b, chk[0], chk[1]))
 
-                s_payload = ''.join('{:02x} '.format(x) for x in m_payload)
-                x_payload = ','.join(['%02x' % x for x in m_payload])
+                # hex dumps of the payload are only made when needed
+                s_payload = None
+                x_payload = None
 
                 if m_class in self.classes:
                     this_class = self.classes[m_class]
                     if 'ids' in this_class:
                         if m_id in this_class['ids']:
                             # got an entry for this message
+                            # look it up once
+                            this_id = this_class['ids'][m_id]
+                            # no minlen, same as minlen 0
+                            minlen = this_id.get('minlen', 0)
                             # name is mandatory
-                            s_payload = this_class['ids'][m_id]['name']
+                            s_payload = this_id['name']
                             s_payload += ':\n'
 
-                            if ((('minlen' in this_class['ids'][m_id]) and
-                                 (0 == m_len) and
-                                 (0 != this_class['ids'][m_id]['minlen']))):
+                            if 0 == m_len and 0 != minlen:
                                 s_payload += "  Poll request"
-                            elif (('minlen' in this_class['ids'][m_id]) and
-                                  (this_class['ids'][m_id]['minlen'] >
-                                   m_len)):
+                            elif minlen > m_len:
                                 # failed minimum length for this message
                                 s_payload += "  Bad Length %s" % m_len
-                            elif 'dec' in this_class['ids'][m_id]:
+                            elif 'dec' in this_id:
                                 # got a decoder for this message
-                                dec = this_class['ids'][m_id]['dec']
+                                dec = this_id['dec']
                                 s_payload += dec(self, m_payload)
                             else:
+                                x_payload = (','.join(['%02x'] * m_len) %
+                                             tuple(m_payload))
                                 s_payload += ("  len %#x, raw %s" %
                                               (m_len, x_payload))
 
+                if s_payload is None:
+                    # unknown message, dump the payload
+                    s_payload = '%02x ' * m_len % tuple(m_payload)
+
+                if ((x_payload is None and
+                     (not s_payload or gps.VERB_INFO <= self.verbosity))):
+                    x_payload = (','.join(['%02x'] * m_len) %
+                                 tuple(m_payload))
+
                 if not s_payload:
                     # huh?
                     s_payload = ("%s, len %#x, raw %s" %
@@ -7854,8 +8064,8 @@ qErrInvalid add in protVer 34 and up
                 if gps.VERB_INFO <= self.verbosity:
                     print("%s, len: %#x" %
                           (self.class_id_s(m_class, m_id), m_len))
-                    x_raw = ','.join(['%02x' % x for x in m_raw[0:4]])
-                    print("header: b5,62,%s" % x_raw)
+                    print("header: b5,62,%02x,%02x,%02x,%02x" %
+                          tuple(m_raw[0:4]))
                     print("payload: %s" % x_payload)
                     print("chksum: %02x,%02x" % (m_ck_a, m_ck_b))
                 print("%s\n" % s_payload)
@@ -7880,6 +8090,9 @@ qErrInvalid add in protVer 34 and up
 
         return [ck_a & 0xff, ck_b & 0xff]
 
+    make_pkt_hdr_struct = struct.Struct('<BBH')
+    make_pkt_chk_struct = struct.Struct('<BB')
+
     def make_pkt(self, m_class, m_id, m_data):
         """Make a message packet"""
         # always little endian, leader, class, id, length
@@ -7887,21 +8100,17 @@ qErrInvalid add in protVer 34 and up
 
         # build core message
         msg = bytearray(m_len + 6)
-        struct.pack_into('<BBH', msg, 0, m_class, m_id, m_len)
+        self.make_pkt_hdr_struct.pack_into(msg, 0, m_class, m_id, m_len)
 
         # copy payload into message buffer
-        i = 0
-        while i < m_len:
-            msg[i + 4] = m_data[i]
-            i += 1
+        msg[4:m_len + 4] = m_data
 
-        # add checksum
+        # add checksum, in the last two bytes of msg
         chk = self.checksum(msg, m_len + 4)
-        m_chk = bytearray(2)
-        struct.pack_into('<BB', m_chk, 0, chk[0], chk[1])
+        self.make_pkt_chk_struct.pack_into(msg, m_len + 4, chk[0], chk[1])
 
         header = b"\xb5\x62"
-        return header + msg[:m_len + 4] + m_chk
+        return header + msg
 
     def gps_send(self, m_class, m_id, m_data):
         """Build, and send, a message to GPS"""
@@ -8688,7 +8897,7 @@ Always double check with "-p CFG-GNSS".
         if port is None:
             port = 1  # Default to port 1 (UART/UART_1)
 
-        if port not in set([1, 2]):
+        if port not in (1, 2):
             sys.stderr.write('gps/ubx: Invalid UART port - %d\n' %
                              (port))
             sys.exit(2)
@@ -8747,7 +8956,7 @@ Always double check with "-p CFG-GNSS".
 
         if layer is None:
             # blast them for now, should do one at a time...
-            for lyr in set([0, 1, 2, 7]):
+            for lyr in (0, 1, 2, 7):
                 m_data[1] = lyr
                 self.gps_send(0x06, 0x8b, m_data)
         else: